@@ -1,85 +1,87 @@
-import json
 import logging
+import re
+import time
 
-from datetime import datetime
 from typing import Union, Tuple, Dict
 
 from pyTigerGraph.common.exception import TigerGraphException
+from pyTigerGraph.common.util import _json_dumps
 
 logger = logging.getLogger(__name__)
 
+# Cached tokens are not reused within this many seconds of their expiration.
+TOKEN_EXPIRATION_FUZZ = 300
+
+_SECRET_RE = re.compile(r"- Secret:\s*(?P<secret>\S+)\s*\n\s*- Alias:\s*(?P<alias>\S+)")
+_CREATE_SECRET_RE = re.compile(r"The secret:\s+(?P<secret>\S+)")
+# Matches the secret and the (possibly autogenerated) alias reported by CREATE SECRET
+_CREATE_SECRET_ALIAS_RE = re.compile(r"The secret:\s+(?P<secret>\S+).*?alias:\s*\"?(?P<alias>\w+)", re.DOTALL)
+
 def _parse_get_secrets(response: str) -> Dict[str, str]:
-    secrets_dict = {}
-    lines = response.split("\n")
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        # s = ""
-        if "- Secret" in line:
-            secret = line.split(": ")[1]
-            i += 1
-            line = lines[i]
-            if "- Alias" in line:
-                secrets_dict[line.split(": ")[1]] = secret
-        i += 1
-    return secrets_dict
+    # Scans the response in place, without splitting it into lines
+    return {m.group("alias"): m.group("secret") for m in _SECRET_RE.finditer(response)}
 
 def _parse_create_secret(response: str, alias: str = "", withAlias: bool = False) -> Union[str, Dict[str, str]]:
-    try:
-        if "already exists" in response:
-            error_msg = "The secret "
-            if alias != "":
-                error_msg += "with alias {} ".format(alias)
-            error_msg += "already exists."
-            raise TigerGraphException(error_msg, "E-00001")
+    if "already exists" in response:
+        error_msg = "The secret "
+        if alias != "":
+            error_msg += "with alias {} ".format(alias)
+        error_msg += "already exists."
+        raise TigerGraphException(error_msg, "E-00001")
+
+    m = _CREATE_SECRET_RE.search(response)
+    if not m:
+        raise TigerGraphException(
+            "Failed to parse secret from response.", "E-00002")
+    secret = m.group("secret")
 
-        secret = "".join(response).replace('\n', '').split(
-            'The secret: ')[1].split(" ")[0].strip()
+    if not withAlias:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", secret)
+        logger.info("exit: createSecret (withAlias")
 
-        if not withAlias:
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(secret))
-            logger.info("exit: createSecret (withAlias")
+        return secret
 
+    if not alias:
+        # The autogenerated alias is reported along with the secret by newer versions
+        m = _CREATE_SECRET_ALIAS_RE.search(response)
+        if not m:
             return secret
+        alias = m.group("alias")
 
-        if alias:
-            ret = {alias: secret}
+    ret = {alias: secret}
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
-            logger.info("exit: createSecret (alias)")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("return: %s", ret)
+    logger.info("exit: createSecret (alias)")
 
-            return ret
+    return ret
 
-        return secret
-
-    except IndexError as e:
-        raise TigerGraphException(
-            "Failed to parse secret from response.", "E-00002") from e
+def _prep_drop_secret(graphname: str, alias: Union[str, list]) -> str:
+    if isinstance(alias, str):
+        alias = [alias]
+    parts = ["USE GRAPH " + graphname]
+    parts.extend("DROP SECRET {}".format(a) for a in alias)
+    return "\n".join(parts)
 
 def _prep_token_request(restppUrl: str,
                         gsUrl: str,
                         graphname: str,
-                        version: str = None,
+                        pre_35: bool = False,
                         secret: str = None,
                         lifetime: int = None,
                         token: str = None,
                         method: str = None):
-    major_ver, minor_ver, patch_ver = (0, 0, 0)
-    if version:
-        major_ver, minor_ver, patch_ver = version.split(".")
-
-    if 0 < int(major_ver) < 3 or (int(major_ver) == 3 and int(minor_ver) < 5):
+    if pre_35:
+        if not secret:
+            raise TigerGraphException(
+                "Cannot request a token with username/password for versions < 3.5.")
         method = "GET"
         url = restppUrl + "/requesttoken?secret=" + secret + \
             ("&lifetime=" + str(lifetime) if lifetime else "") + \
             ("&token=" + token if token else "")
         authMode = None
-        if not secret:
-            raise TigerGraphException(
-                "Cannot request a token with username/password for versions < 3.5.")
+        data = alt_url = alt_data = None
     else:
         method = "POST"
         url = gsUrl + "/gsql/v1/tokens"  # used for TG 4.x
@@ -102,23 +104,26 @@ def _prep_token_request(restppUrl: str,
         else:
             authMode = "pwd"
 
-        alt_data = json.dumps(alt_data)
+        alt_data = _json_dumps(alt_data)
 
     return method, url, alt_url, authMode, data, alt_data
 
+def _token_auth_header(token: str, setToken: bool, base64_credential: str) -> dict:
+    if setToken:
+        return {'Authorization': "Bearer " + token}
+    return {'Authorization': 'Basic {0}'.format(base64_credential)}
+
+def _format_expiration(expiration) -> str:
+    # Formats a 3.x unix expiration timestamp as UTC "YYYY-MM-DD hh:mm:ss", without datetime objects
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(float(expiration)))
+
 def _parse_token_response(response: dict,
                           setToken: bool,
                           mainVer: int,
                           base64_credential: str) -> Tuple[Union[Tuple[str, str], str], dict]:
     if not response.get("error"):
         token = response["token"]
-        if setToken:
-            apiToken = token
-            authHeader = {'Authorization': "Bearer " + apiToken}
-        else:
-            apiToken = None
-            authHeader = {
-                'Authorization': 'Basic {0}'.format(base64_credential)}
+        authHeader = _token_auth_header(token, setToken, base64_credential)
 
         if response.get("expiration"):
             # On >=4.1 the format for the date of expiration changed. Convert back to old format
@@ -127,8 +132,7 @@ def _parse_token_response(response: dict,
                 return (token, response.get("expiration")), authHeader
             else:
                 return (token, response.get("expiration"), \
-                    datetime.utcfromtimestamp(
-                        float(response.get("expiration"))).strftime('%Y-%m-%d %H:%M:%S')), authHeader
+                    _format_expiration(response.get("expiration"))), authHeader
         else:
             return token, authHeader
 
@@ -138,3 +142,34 @@ def _parse_token_response(response: dict,
     else:
         raise TigerGraphException(
             response["message"], (response["code"] if "code" in response else None))
+
+def _get_cached_token(token_cache: dict, key: tuple) -> Union[Tuple[str, str], str, None]:
+    """Returns the cached return value of `getToken()` for `key`, or `None` if there is no
+    cached token or it is about to expire.
+    """
+    cached = token_cache.get(key)
+    if cached and cached[1] - time.time() > TOKEN_EXPIRATION_FUZZ:
+        return cached[0]
+    return None
+
+def _cache_token(token_cache: dict,
+                 key: tuple,
+                 token: Union[Tuple[str, str], str],
+                 response: dict,
+                 lifetime: int = None) -> None:
+    try:
+        expiration = float(response["expiration"])
+    except (KeyError, TypeError, ValueError):
+        # TG 4.x returns the expiration as a local time string; fall back to the requested
+        # lifetime and don't cache if the server's default lifetime was used.
+        if not lifetime:
+            return
+        expiration = time.time() + int(lifetime)
+    token_cache[key] = (token, expiration)
+
+def _invalidate_cached_tokens(token_cache: dict, token: str = None) -> None:
+    if isinstance(token, tuple):
+        token = token[0]
+    for key, (cached, _) in list(token_cache.items()):
+        if not token or (cached[0] if isinstance(cached, tuple) else cached) == token:
+            del token_cache[key]
@@ -5,10 +5,10 @@ A TigerGraphConnection object provides the HTTP(S) communication used by all oth
 """
 
 import base64
-import json
 import logging
 import sys
 import re
+import socket
 import warnings
 import requests
 
@@ -16,6 +16,7 @@ from typing import Union
 from urllib.parse import urlparse
 
 from pyTigerGraph.common.exception import TigerGraphException
+from pyTigerGraph.common.util import _json_loads
 
 
 def excepthook(type, value, traceback):
@@ -31,6 +32,25 @@ def excepthook(type, value, traceback):
 
 logger = logging.getLogger(__name__)
 
+# Applied to the sockets of both the sync and async HTTP clients: requests are small and
+# chatty, so they are sent without Nagle delays, and idle pooled connections are kept alive.
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+
+
+def _parse_version(version: str) -> tuple:
+    """Parses a `major.minor.patch` version string into a tuple of ints.
+
+    Missing or non-numeric components are read as 0, so `""` becomes `(0, 0, 0)`.
+    """
+    parts = []
+    for component in version.split(".")[:3]:
+        m = re.match(r"\d+", component.strip())
+        parts.append(int(m.group()) if m else 0)
+    return tuple(parts + [0] * (3 - len(parts)))
+
 
 class PyTigerGraphCore(object):
     def __init__(self, host: str = "http://127.0.0.1", graphname: str = "MyGraph",
@@ -86,7 +106,7 @@ class PyTigerGraphCore(object):
 
         """
         logger.info("entry: __init__")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         inputHost = urlparse(host)
@@ -107,11 +127,25 @@ class PyTigerGraphCore(object):
 
         self.jwtToken = jwtToken
         self.apiToken = apiToken
+        # Tokens requested by getToken(), keyed by (secret, graphname, lifetime)
+        self._token_cache = {}
+        # Major version (3 or 4) of the token endpoint that last answered, see _token()
+        self._token_endpoint_ver = None
+        # Graphs found by check_exist_graphs(), mapped to when that result expires
+        self._graph_exists_cache = {}
+        # (graphname, expiry, {name: fields}) of the last UDT list fetched for getUDT()/getUDTs()
+        self._udt_cache = None
         self.base64_credential = base64.b64encode(
             "{0}:{1}".format(self.username, self.password).encode("utf-8")).decode("utf-8")
+        # Authorization headers are built once and shared by requests, see _bearer_header()
+        self._basic_header = {"Authorization": "Basic {0}".format(self.base64_credential)}
+        self._bearer = (None, None)
 
         self.authHeader = self._set_auth_header()
 
+        # Whether the database version is greater than 4.0, see _version_greater_than_4_0()
+        self._version_gt_4_0 = None
+
         # TODO Eliminate version and use gsqlVersion only, meaning TigerGraph server version
         if gsqlVersion:
             self.version = gsqlVersion
@@ -212,11 +246,21 @@ class PyTigerGraphCore(object):
     def _set_auth_header(self):
         """Set the authentication header based on available tokens or credentials."""
         if self.jwtToken:
-            return {"Authorization": "Bearer " + self.jwtToken}
+            return self._bearer_header(self.jwtToken)
         elif self.apiToken:
-            return {"Authorization": "Bearer " + self.apiToken}
+            return self._bearer_header(self.apiToken)
         else:
-            return {"Authorization": "Basic {0}".format(self.base64_credential)}
+            return self._basic_header
+
+    def _bearer_header(self, token: str) -> dict:
+        """NO DOC
+
+        Returns the `Bearer` authorization header for `token`. The header of the last token is
+        kept, so it is only rebuilt when the token changes.
+        """
+        if self._bearer[0] != token:
+            self._bearer = (token, {"Authorization": "Bearer " + token})
+        return self._bearer[1]
 
     def _verify_jwt_token_support(self):
         try:
@@ -272,7 +316,7 @@ class PyTigerGraphCore(object):
 
     def _prep_req(self, authMode, headers, url, method, data):
         logger.info("entry: _req")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         _headers = {}
@@ -289,21 +333,20 @@ class PyTigerGraphCore(object):
                 token = None
 
             if token:
-                self.authHeader = {'Authorization': "Bearer " + token}
-                _headers = self.authHeader
+                self.authHeader = self._bearer_header(token)
             else:
-                self.authHeader = {
-                    'Authorization': 'Basic {0}'.format(self.base64_credential)}
-                _headers = self.authHeader
+                self.authHeader = self._basic_header
                 authMode = 'pwd'
+            _headers = self.authHeader
 
         if authMode == "pwd":
             if self.jwtToken:
-                _headers = {'Authorization': "Bearer " + self.jwtToken}
+                _headers = self._bearer_header(self.jwtToken)
             else:
-                _headers = {'Authorization': 'Basic {0}'.format(
-                    self.base64_credential)}
+                _headers = self._basic_header
 
+        # The authorization headers are shared, the headers of this request are added to a copy
+        _headers = dict(_headers)
         if headers:
             _headers.update(headers)
         if self.awsIamHeaders:
@@ -326,10 +369,23 @@ class PyTigerGraphCore(object):
 
         return _headers, _data, verify
 
+    @property
+    def version(self) -> str:
+        """The database version given when creating the connection (empty if not given)."""
+        return self._version
+
+    @version.setter
+    def version(self, version: str):
+        self._version = version
+        self._version_tuple = _parse_version(version or "")
+        major, minor, _ = self._version_tuple
+        # Versions before 3.5 request tokens with GET /requesttoken and need a secret
+        self._is_pre_35 = 0 < major < 3 or (major == 3 and minor < 5)
+
     def _parse_req(self, res, jsonResponse, strictJson, skipCheck, resKey):
         if jsonResponse:
             try:
-                res = json.loads(res.text, strict=strictJson)
+                res = _json_loads(res, strictJson)
             except:
                 raise TigerGraphException("Cannot parse json: " + res.text)
         else:
@@ -338,14 +394,14 @@ class PyTigerGraphCore(object):
         if not skipCheck:
             self._error_check(res)
         if not resKey:
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(res))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", res)
             logger.info("exit: _req (no resKey)")
 
             return res
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res[resKey]))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res[resKey])
         logger.info("exit: _req (resKey)")
 
         return res[resKey]
@@ -4,28 +4,48 @@ from pyTigerGraph.datasets import Datasets
 
 logger = logging.getLogger(__name__)
 
-def _parse_ingest_dataset(responses: str, cleanup: bool, dataset: Datasets):
-    for resp in responses:
-        stats = resp[0]["statistics"]
-        if "vertex" in stats:
-            for vstats in stats["vertex"]:
-                print(
-                    "Ingested {} objects into VERTEX {}".format(
-                        vstats["validObject"], vstats["typeName"]
-                    ),
-                    flush=True,
-                )
-        if "edge" in stats:
-            for estats in stats["edge"]:
-                print(
-                    "Ingested {} objects into EDGE {}".format(
-                        estats["validObject"], estats["typeName"]
-                    ),
-                    flush=True,
-                )
-        if logger.level == logging.DEBUG:
-            logger.debug(str(resp))
+# Seconds for which a graph found by check_exist_graphs() is assumed to still exist.
+GRAPH_EXISTS_TTL = 60
+
+def _prep_check_exist_graphs(gsUrl: str, name: str, is_v4: bool) -> str:
+    if is_v4:
+        return gsUrl + "/gsql/v1/schema/graphs/" + name
+    return gsUrl + "/gsqlserver/gsql/schema?graph=" + name
+
+def _parse_check_exist_graphs(res) -> bool:
+    # Both schema endpoints report a missing graph with error set to true
+    return not res.get("error", True)
+
+def _parse_ingest_dataset_response(resp):
+    stats = resp[0]["statistics"]
+    if "vertex" in stats:
+        for vstats in stats["vertex"]:
+            print(
+                "Ingested {} objects into VERTEX {}".format(
+                    vstats["validObject"], vstats["typeName"]
+                ),
+                flush=True,
+            )
+    if "edge" in stats:
+        for estats in stats["edge"]:
+            print(
+                "Ingested {} objects into EDGE {}".format(
+                    estats["validObject"], estats["typeName"]
+                ),
+                flush=True,
+            )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(str(resp))
 
+def _clean_up_ingest_dataset(cleanup: bool, dataset: Datasets):
     if cleanup:
         print("---- Cleaning ----", flush=True)
         dataset.clean_up()
+
+def _parse_ingest_dataset(responses, cleanup: bool, dataset: Datasets):
+    # responses can be the generator returned by run_load_job(), in which case each file is
+    # loaded right before its statistics are printed
+    for resp in responses:
+        _parse_ingest_dataset_response(resp)
+
+    _clean_up_ingest_dataset(cleanup, dataset)
@@ -23,8 +23,8 @@ def _parse_get_edge_source_vertex_type(edgeTypeDetails):
     if edgeTypeDetails["FromVertexTypeName"] != "*":
         ret = edgeTypeDetails["FromVertexTypeName"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeSourceVertexType (single source)")
 
         return ret
@@ -36,14 +36,14 @@ def _parse_get_edge_source_vertex_type(edgeTypeDetails):
         for ep in edgeTypeDetails["EdgePairs"]:
             vts.add(ep["From"])
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(vts))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", vts)
         logger.info("exit: getEdgeSourceVertexType (multi source)")
 
         return vts
     else:
         # 2.6.1 and earlier notation
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("return: *")
         logger.info(
             "exit: getEdgeSourceVertexType (multi source, pre-3.x)")
@@ -55,8 +55,8 @@ def _parse_get_edge_target_vertex_type(edgeTypeDetails):
     if edgeTypeDetails["ToVertexTypeName"] != "*":
         ret = edgeTypeDetails["ToVertexTypeName"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeTargetVertexType (single target)")
 
         return ret
@@ -68,14 +68,14 @@ def _parse_get_edge_target_vertex_type(edgeTypeDetails):
         for ep in edgeTypeDetails["EdgePairs"]:
             vts.add(ep["To"])
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(vts))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", vts)
         logger.info("exit: getEdgeTargetVertexType (multi target)")
 
         return vts
     else:
         # 2.6.1 and earlier notation
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("return: *")
         logger.info(
             "exit: getEdgeTargetVertexType (multi target, pre-3.x)")
@@ -124,8 +124,8 @@ def _parse_get_edge_count_from(res, edgeType):
     if len(res) == 1 and res[0]["e_type"] == edgeType:
         ret = res[0]["count"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeCountFrom (single edge type)")
 
         return ret
@@ -467,8 +467,8 @@ def edgeSetToDataFrame(edgeSet: list,
 
     ret = pd.concat(cols, axis=1)
 
-    if logger.level == logging.DEBUG:
-        logger.debug("return: " + str(ret))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("return: %s", ret)
     logger.info("exit: edgeSetToDataFrame")
 
     return ret
@@ -54,8 +54,8 @@ def _parse_gsql(res, query: str, graphname: str = None, options=None):
 
     string_without_ansi = ANSI_ESCAPE.sub('', ret)
 
-    if logger.level == logging.DEBUG:
-        logger.debug("return: " + str(ret))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("return: %s", ret)
     logger.info("exit: gsql (success)")
 
     return string_without_ansi
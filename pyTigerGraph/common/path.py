@@ -76,8 +76,8 @@ def _prepare_path_params(sourceVertices: Union[dict, tuple, list],
             else:
                 logger.warning("Invalid vertex type or value: " + str(v))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: parseVertices")
 
         return ret
@@ -110,7 +110,7 @@ def _prepare_path_params(sourceVertices: Union[dict, tuple, list],
             else:
                 logger.warning("Invalid filter type or value: " + str(f))
 
-        logger.debug("return: " + str(ret))
+        logger.debug("return: %s", ret)
         logger.info("exit: parseFilters")
 
         return ret
@@ -135,7 +135,7 @@ def _prepare_path_params(sourceVertices: Union[dict, tuple, list],
 
     ret = json.dumps(data)
 
-    logger.debug("return: " + str(ret))
+    logger.debug("return: %s", ret)
     logger.info("exit: _preparePathParams")
 
     return ret
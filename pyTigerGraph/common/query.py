@@ -88,8 +88,8 @@ def _parse_query_parameters(params: dict) -> str:
             ret += k + "=" + _safe_char(v) + "&"
     ret = ret[:-1]
 
-    if logger.level == logging.DEBUG:
-        logger.debug("return: " + str(ret))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("return: %s", ret)
     logger.info("exit: _parseQueryParameters")
 
     return ret
@@ -11,6 +11,9 @@ from typing import Union
 
 logger = logging.getLogger(__name__)
 
+# Seconds for which UDT definitions fetched by getUDTs()/getUDT() are reused.
+UDT_CACHE_TTL = 5
+
 def _get_attr_type(attrType: dict) -> str:
     """Returns attribute data type in simple format.
 
@@ -66,8 +69,8 @@ def _upsert_attrs(attributes: dict) -> dict:
         else:
             vals[attr] = {"value": val}
 
-    if logger.level == logging.DEBUG:
-        logger.debug("return: " + str(vals))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("return: %s", vals)
     logger.info("exit: _upsertAttrs")
 
     return vals
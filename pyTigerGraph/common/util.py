@@ -4,7 +4,9 @@ Utility functions for pyTigerGraph.
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object].
 """
 
+import json
 import logging
+import math
 import urllib
 
 from typing import Any, TYPE_CHECKING
@@ -12,8 +14,54 @@ from urllib.parse import urlparse
 
 from pyTigerGraph.common.exception import TigerGraphException
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+def _json_loads(res, strict: bool = True) -> Any:
+    """Parses the JSON body of a `requests` or `httpx` response.
+
+    If `orjson` is installed, it parses the raw bytes of the body without decoding them first.
+    It is only used for strict parsing. Anything it rejects (e.g. `NaN` or integers exceeding 64
+    bits) is parsed by the `json` module instead.
+    """
+    if orjson is not None and strict:
+        try:
+            return orjson.loads(res.content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(res.text, strict=strict)
+
+def _has_non_finite(obj: Any) -> bool:
+    """Checks whether `obj` contains a `NaN` or infinite float, in any nested dict or list."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+def _json_dumps(obj: Any) -> str:
+    """Serializes `obj` to a JSON string, using `orjson` if it is installed.
+
+    `orjson` writes `NaN` and infinite floats as `null`, so payloads containing them are
+    serialized by the `json` module instead, which writes `NaN`, `Infinity` and `-Infinity`.
+    """
+    if orjson is not None:
+        try:
+            ret = orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+        else:
+            # Only payloads with a null in them can have had a non-finite float replaced
+            if "null" not in ret or not _has_non_finite(obj):
+                return ret
+    return json.dumps(obj)
+
 def _safe_char(inputString: Any) -> str:
     """Replace special characters in string using the %xx escape.
 
@@ -210,8 +210,8 @@ def vertexSetToDataFrame(vertexSet: list, withId: bool = True,
 
     ret = pd.concat(cols, axis=1)
 
-    if logger.level == logging.DEBUG:
-        logger.debug("return: " + str(ret))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("return: %s", ret)
     logger.info("exit: vertexSetToDataFrame")
 
     return ret
@@ -0,0 +1,56 @@
+"""Delimited text splitting
+Vectorized scans for splitting delimited batches when PyArrow is not available.
+"""
+from typing import Union
+
+import numpy as np
+
+__all__ = ["find_newlines", "split_fields"]
+
+NEWLINE = ord("\n")
+
+
+def find_newlines(buf: bytes) -> np.ndarray:
+    """NO DOC: Offsets of all newlines in `buf`, found with one vectorized compare."""
+    return np.flatnonzero(np.frombuffer(buf, dtype=np.uint8) == NEWLINE)
+
+
+def split_fields(raw: Union[str, bytes], delimiter: str, ncols: int) -> Union[np.ndarray, None]:
+    """NO DOC: Split a delimited batch into a `(n_rows, ncols)` object array of strings.
+
+    The bytes are scanned for newlines and delimiters with numpy (both are ASCII, so this
+    is safe on UTF-8), which checks that every line has exactly `ncols` fields. The text is
+    then split in a single pass instead of line by line. Returns `None` if the batch is not
+    a plain table, e.g. for empty or ragged lines, so the caller can fall back.
+    """
+    if len(delimiter) != 1 or ord(delimiter) > 127 or delimiter == "\n":
+        return None
+    if isinstance(raw, str):
+        text = raw
+        buf = raw.encode("utf-8")
+    else:
+        buf = bytes(raw)
+        text = None
+    if not buf:
+        return None
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    ends = np.flatnonzero(arr == NEWLINE)
+    trailing = arr[-1] == NEWLINE
+    if not trailing:
+        ends = np.append(ends, len(arr))
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    if (ends == starts).any():
+        return None
+    delims = np.flatnonzero(arr == ord(delimiter))
+    counts = np.searchsorted(delims, ends) - np.searchsorted(delims, starts)
+    if (counts != ncols - 1).any():
+        return None
+
+    if text is None:
+        text = buf.decode("utf-8")
+    fields = text.replace("\n", delimiter).split(delimiter)
+    if trailing:
+        fields.pop()
+    return np.array(fields, dtype=object).reshape(len(ends), ncols)
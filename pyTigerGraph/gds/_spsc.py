@@ -0,0 +1,116 @@
+"""Single-producer single-consumer queue
+A bounded queue for handing batches from a loader's reader thread to the consumer.
+"""
+from queue import Empty, Full
+from threading import Event
+from time import monotonic
+from typing import Any, List
+
+__all__ = ["SPSCQueue"]
+
+
+class SPSCQueue:
+    """NO DOC: Bounded queue for exactly one producer thread and one consumer thread.
+
+    Items are stored in a preallocated ring whose capacity is a power of two, so slots are
+    found with `index & mask`. Only the producer advances `_tail` and only the consumer
+    advances `_head`, so no lock is taken to hand over an item. The events are only used
+    to sleep while the queue is full or empty. Supports the subset of the `queue.Queue`
+    interface used by the loaders.
+
+    Items handed out by `get_many` keep their slots until the consumer's next `get` or
+    `get_many`, so they count towards `maxsize` while the consumer still holds them.
+    """
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        capacity = 1
+        while capacity < maxsize:
+            capacity <<= 1
+        self.maxsize = maxsize
+        self._mask = capacity - 1
+        self._buffer = [None] * capacity
+        # Slots before _head are free for the producer, items before _read have been
+        # handed out. The two differ only while items of a `get_many` are held.
+        self._head = 0
+        self._read = 0
+        self._tail = 0
+        self._not_empty = Event()
+        self._not_full = Event()
+
+    def qsize(self) -> int:
+        return self._tail - self._read
+
+    def empty(self) -> bool:
+        return self._tail == self._read
+
+    def full(self) -> bool:
+        return self._tail - self._head >= self.maxsize
+
+    @staticmethod
+    def _wait(event: Event, ready, block: bool, timeout: float, exc: type) -> None:
+        # Clear before re-checking so that a notification between the two is not lost
+        deadline = None if timeout is None else monotonic() + timeout
+        while not ready():
+            if not block:
+                raise exc
+            event.clear()
+            if ready():
+                break
+            if deadline is None:
+                event.wait()
+            else:
+                remaining = deadline - monotonic()
+                if remaining <= 0 or not event.wait(remaining):
+                    if not ready():
+                        raise exc
+
+    def put(self, item: Any, block: bool = True, timeout: float = None) -> None:
+        """NO DOC: Add an item. Must only be called from the producer thread."""
+        if self._tail - self._head >= self.maxsize:
+            self._wait(self._not_full, lambda: not self.full(), block, timeout, Full)
+        self._buffer[self._tail & self._mask] = item
+        self._tail += 1
+        if not self._not_empty.is_set():
+            self._not_empty.set()
+
+    def _release(self) -> None:
+        # Free the slots of the items handed out by the last `get_many`
+        if self._head != self._read:
+            self._head = self._read
+            if not self._not_full.is_set():
+                self._not_full.set()
+
+    def get(self, block: bool = True, timeout: float = None) -> Any:
+        """NO DOC: Remove and return an item. Must only be called from the consumer thread."""
+        self._release()
+        if self._tail == self._read:
+            self._wait(self._not_empty, lambda: not self.empty(), block, timeout, Empty)
+        idx = self._read & self._mask
+        item = self._buffer[idx]
+        self._buffer[idx] = None
+        self._read += 1
+        self._head = self._read
+        if not self._not_full.is_set():
+            self._not_full.set()
+        return item
+
+    def get_many(self, max_items: int, block: bool = True, timeout: float = None) -> List[Any]:
+        """NO DOC: Remove and return up to `max_items` items, waiting for at least one.
+
+        All items available at the time are taken in one handoff. Their slots are freed by
+        the next `get` or `get_many`, so the items held by the consumer and those still in the
+        queue never exceed `maxsize` together. Must only be called from the consumer thread.
+        """
+        self._release()
+        if self._tail == self._read:
+            self._wait(self._not_empty, lambda: not self.empty(), block, timeout, Empty)
+        read = self._read
+        n = min(self._tail - read, max_items)
+        items = []
+        for i in range(read, read + n):
+            idx = i & self._mask
+            items.append(self._buffer[idx])
+            self._buffer[idx] = None
+        self._read = read + n
+        return items
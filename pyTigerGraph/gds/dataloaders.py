@@ -13,12 +13,14 @@ import logging
 import warnings
 import math
 import os
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from queue import Empty, Queue
-from threading import Event, Thread
+from threading import Event, Lock, Thread
 from time import sleep
 import pickle
-from typing import TYPE_CHECKING, Any, Iterator, NoReturn, Tuple, Union, Callable
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, NoReturn, Tuple, Union, Callable
 #import re
 
 #RE_SPLITTER = re.compile(r',(?![^\[]*\])')
@@ -37,14 +39,282 @@ if TYPE_CHECKING:
 import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+
 from ..common.exception import TigerGraphException
+from ._fastsplit import split_fields
+from ._spsc import SPSCQueue
 from .utilities import install_query_file, random_string, add_attribute
 
 __all__ = ["VertexLoader", "EdgeLoader", "NeighborLoader", "GraphLoader", "EdgeNeighborLoader", "NodePieceLoader", "HGTLoader"]
 
 RANDOM_TOPIC_LEN = 8
+# Inputs larger than this (in characters) are parsed in parallel
+PARALLEL_PARSE_THRESHOLD = 256 * 1024
 logger = logging.getLogger(__name__)
 
+_parse_pool = None
+_parse_pool_lock = Lock()
+
+
+def _data_queue(maxsize: int) -> Union[SPSCQueue, Queue]:
+    """NO DOC: Create the queue between a loader's reader thread and its consumer.
+
+    The reader is the only producer and the iterating thread the only consumer, so the
+    lock-free ring can be used unless an unbounded buffer was asked for.
+    """
+    if maxsize > 0:
+        return SPSCQueue(maxsize)
+    return Queue(maxsize)
+
+
+def _get_parse_pool() -> ThreadPoolExecutor:
+    """NO DOC: Return the thread pool shared by all loaders for parsing large batches."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="tg_parse")
+    return _parse_pool
+
+
+@lru_cache(maxsize=None)
+def _arrow_csv_options(columns: tuple, delimiter: str, check_utf8: bool = True) -> Union[tuple, None]:
+    """NO DOC: Build the PyArrow CSV options for a table layout once instead of per batch.
+
+    `check_utf8=False` skips arrow's UTF-8 validation, for input already known to be valid.
+    Returns `None` if the column names are not unique, which the arrow reader does not support.
+    """
+    if len(set(columns)) != len(columns):
+        return None
+    return (
+        # Large inputs are split into blocks at line boundaries and parsed on arrow's threads
+        pa_csv.ReadOptions(column_names=list(columns), block_size=PARALLEL_PARSE_THRESHOLD),
+        pa_csv.ParseOptions(
+            delimiter=delimiter, quote_char=False, escape_char=False,
+            ignore_empty_lines=True),
+        pa_csv.ConvertOptions(
+            column_types=pa.schema([(col, pa.string()) for col in columns]),
+            null_values=[], strings_can_be_null=False, check_utf8=check_utf8))
+
+
+class _AttrSpec(NamedTuple):
+    """NO DOC: How an attribute is converted into features, derived from its type once."""
+    name: str
+    # Lowercased attribute type, e.g. "int" or "list:double"
+    type: str
+    # One of "str", "map", "list", "str_list", "unsupported", "bool", "uint" or "num"
+    kind: str
+    # numpy dtype of the values, or of the elements for lists
+    dtype: Any
+
+
+def _np_dtype(dtype: str) -> Any:
+    try:
+        return np.dtype(dtype)
+    except TypeError:
+        # Let the conversion itself report unknown types, as before
+        return dtype
+
+
+@lru_cache(maxsize=None)
+def _compile_attr_specs(attrs: Tuple[Tuple[str, str], ...]) -> Tuple[_AttrSpec, ...]:
+    """NO DOC: Compile `(name, type)` pairs into `_AttrSpec`s.
+
+    The attributes and their types are fixed for a loader, so this is computed once and
+    looked up for every batch.
+    """
+    specs = []
+    for name, attr_type in attrs:
+        dtype = attr_type.lower()
+        if dtype.startswith("str"):
+            spec = _AttrSpec(name, dtype, "str", None)
+        elif dtype.startswith("list"):
+            dtype2 = dtype.split(":")[1]
+            if dtype2.startswith("str"):
+                spec = _AttrSpec(name, dtype, "str_list", dtype2)
+            else:
+                spec = _AttrSpec(name, dtype, "list", _np_dtype(dtype2))
+        elif dtype.startswith("map"):
+            spec = _AttrSpec(name, dtype, "map", None)
+        elif dtype.startswith("set") or dtype.startswith("date"):
+            spec = _AttrSpec(name, dtype, "unsupported", None)
+        elif dtype == "bool":
+            spec = _AttrSpec(name, dtype, "bool", _np_dtype(dtype))
+        elif dtype == "uint":
+            spec = _AttrSpec(name, dtype, "uint", _np_dtype(dtype))
+        else:
+            spec = _AttrSpec(name, dtype, "num", _np_dtype(dtype))
+        specs.append(spec)
+    return tuple(specs)
+
+
+def _attr_specs(attr_names: list, attr_types: dict) -> Tuple[_AttrSpec, ...]:
+    """NO DOC: Look up the compiled specs of `attr_names`."""
+    return _compile_attr_specs(tuple((col, attr_types[col]) for col in attr_names))
+
+
+def _split_list_column(values: pd.Series, dtype: Any) -> np.ndarray:
+    """NO DOC: Split a column of space separated lists into a 2D array of `dtype`.
+
+    Numeric lists in the regular layout TigerGraph prints them in are parsed by numpy in
+    a single pass over the joined column. Anything else goes through pandas as before.
+    """
+    if isinstance(dtype, np.dtype) and dtype.kind in "if" and len(values) and values.dtype == object:
+        try:
+            rows = values.to_list()
+            joined = "\n".join(rows)
+        except TypeError:
+            rows = None
+        # With single spaces only, every row has the same number of elements iff the
+        # rows have the same number of spaces and all or none of them end in a space
+        if (rows is not None
+                and len({row.count(" ") for row in rows}) == 1
+                and len({row.endswith(" ") for row in rows}) == 1
+                and not joined.startswith((" ", "\n")) and not joined.endswith("\n")
+                and "  " not in joined and "\n " not in joined and "\n\n" not in joined
+                and "\t" not in joined):
+            width = rows[0].count(" ") + (not rows[0].endswith(" "))
+            try:
+                flat = np.fromstring(
+                    joined, dtype=np.int64 if dtype.kind == "i" else dtype, sep=" ")
+            except (ValueError, OverflowError):
+                # Malformed elements, which pandas reports with its own error below
+                flat = None
+            if flat is not None and dtype.kind == "i" and flat.size:
+                # numpy saturates on overflow where pandas raises, so values at the limits
+                # of the type are left to pandas
+                info = np.iinfo(dtype)
+                if flat.min() <= info.min or flat.max() >= info.max:
+                    flat = None
+            if flat is not None and width and flat.size == len(rows) * width:
+                return flat.astype(dtype, copy=False).reshape(len(rows), width)
+    return values.str.split(expand=True).to_numpy().astype(dtype)
+
+
+def _as_tensor(values: Union[np.ndarray, pd.Series]) -> "torch.Tensor":
+    """NO DOC: Wrap numeric values as a tensor, sharing their memory instead of copying
+    them element by element whenever possible.
+    """
+    import torch
+
+    arr = np.ascontiguousarray(values)
+    if not arr.flags.writeable:
+        # torch.from_numpy warns about read-only arrays, e.g. views of pandas data
+        arr = arr.copy()
+    return torch.from_numpy(arr)
+
+
+def _decode_batch(raw: Union[str, bytes, tuple]) -> Union[str, tuple]:
+    """NO DOC: Decode a raw batch, or a (vertex, edge) pair of them, passed on as bytes."""
+    if isinstance(raw, tuple):
+        return tuple(_decode_batch(part) for part in raw)
+    if isinstance(raw, (bytes, bytearray, memoryview)):
+        return bytes(raw).decode("utf-8")
+    return raw
+
+
+def _read_table_arrow(raw: Union[str, bytes], columns: list, delimiter: str) -> Union[pd.DataFrame, None]:
+    """NO DOC: Read a delimited table with the PyArrow CSV reader.
+
+    Every field is read as a string and columns are then converted the same way
+    `pd.to_numeric(errors="ignore")` would. Returns `None` if the input is not a plain
+    table (e.g. ragged rows or no rows), in which case the Python parser is used.
+    """
+    # The arrow reader only supports single character ASCII delimiters
+    if pa is None or len(delimiter) != 1 or ord(delimiter) > 127:
+        return None
+    if isinstance(raw, str):
+        if "\r" in raw:
+            return None
+        raw = raw.encode("utf-8")
+        # Encoded by us, so it is valid UTF-8
+        check_utf8 = False
+    else:
+        if b"\r" in raw:
+            return None
+        # ASCII, which most batches are, is valid UTF-8 and much cheaper to check
+        check_utf8 = not (isinstance(raw, (bytes, bytearray)) and raw.isascii())
+    options = _arrow_csv_options(tuple(columns), delimiter, check_utf8)
+    if options is None:
+        return None
+    read_options, parse_options, convert_options = options
+    try:
+        try:
+            table = pa_csv.read_csv(
+                # Bytes are read in place, without a copy
+                pa.BufferReader(pa.py_buffer(raw)),
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options)
+        except pa.ArrowInvalid as err:
+            # A row longer than a block cannot be split, so read the input as one block
+            if "straddling" not in str(err) or len(raw) < read_options.block_size:
+                raise
+            table = pa_csv.read_csv(
+                pa.BufferReader(pa.py_buffer(raw)),
+                read_options=pa_csv.ReadOptions(
+                    column_names=list(columns), block_size=len(raw) + 1),
+                parse_options=parse_options,
+                convert_options=convert_options)
+    except (pa.ArrowInvalid, ValueError) as err:
+        logger.debug("Falling back to the Python parser: %s", err)
+        return None
+    if table.num_rows == 0:
+        return None
+    arrays = []
+    fallback = []
+    for i, col in enumerate(columns):
+        arr = table.column(i)
+        # arrow casts hexadecimal strings such as "0x1F" to integers, pandas keeps them as strings
+        casts = () if pc.any(pc.match_substring_regex(arr, "[xX]")).as_py() else (
+            pa.int64(), pa.uint64(), pa.float64())
+        for typ in casts:
+            try:
+                converted = pc.cast(arr, typ)
+            except pa.ArrowInvalid:
+                continue
+            # pandas does not read every spelling of NaN as a number and keeps integers written
+            # in forms arrow rejects (e.g. "+3") as ints, so those columns are left to it. It also
+            # keeps integers beyond the 64 bit range as strings and reads long integers as floats
+            # slightly differently, so columns with integers of 19 digits or more go to it too.
+            if typ != pa.float64() or (
+                    pc.all(pc.is_finite(converted)).as_py()
+                    and pc.any(pc.match_substring_regex(arr, "[.eE]")).as_py()
+                    and not pc.any(pc.match_substring_regex(arr, "^[+-]?[0-9]{19,}$")).as_py()):
+                arr = converted
+                break
+        else:
+            # Leave the exact pandas semantics (e.g. empty strings, NaN) to pandas
+            fallback.append(col)
+        arrays.append(arr)
+    df = pa.Table.from_arrays(arrays, names=columns).to_pandas()
+    for col in fallback:
+        df[col] = pd.to_numeric(df[col], errors="ignore")
+    return df
+
+
+def _read_table(raw: Union[str, bytes], columns: list, delimiter: str) -> pd.DataFrame:
+    """NO DOC: Read a delimited table into a dataframe with numeric columns converted."""
+    df = _read_table_arrow(raw, columns, delimiter)
+    if df is not None:
+        return df
+    fields = split_fields(raw, delimiter, len(columns))
+    if fields is not None:
+        df = pd.DataFrame(fields, columns=columns)
+    else:
+        raw = _decode_batch(raw)
+        rows = (line.split(delimiter) for line in raw.split('\n') if line)
+        df = pd.DataFrame(rows, columns=columns)
+    for column in df.columns:
+        df[column] = pd.to_numeric(df[column], errors="ignore")
+    return df
+
 class BaseLoader:
     """NO DOC: Base Dataloader Class."""
     def __init__(
@@ -216,6 +486,9 @@ class BaseLoader:
         self.reverse_edge = reverse_edge
         self._graph = graph
         self._v_schema, self._e_schema = self._get_schema()
+        # Attribute names allowed for each type, used to validate attribute inputs
+        self._v_valid = {vtype: frozenset(attrs) for vtype, attrs in self._v_schema.items()}
+        self._e_valid = {etype: frozenset(attrs) for etype, attrs in self._e_schema.items()}
         # Initialize basic params
         if loader_id:
             self.loader_id = loader_id
@@ -234,6 +507,8 @@ class BaseLoader:
         self.timeout = timeout
         self._iterations = 0
         self._iterator = False
+        # Batches taken off the data queue in one handoff and not returned yet
+        self._pending = deque()
         self.callback_fn = callback_fn
         self.distributed_query = distributed_query
         self.num_heap_inserts = 10
@@ -404,9 +679,9 @@ class BaseLoader:
         is_hetero: bool = False
     ) -> Union[list, dict]:
         if schema_type == "vertex":
-            schema = self._v_schema
+            schema = self._v_valid
         elif schema_type == "edge":
-            schema = self._e_schema
+            schema = self._e_valid
         else:
             raise ValueError("Schema type can only be vertex or edge.")
         if not attributes:
@@ -421,12 +696,10 @@ class BaseLoader:
         if isinstance(attributes, list):
             if is_hetero:
                 raise ValueError("Input to attributes should be dict or None if you want heterogeneous graph output.")
-            for i in range(len(attributes)):
-                attributes[i] = attributes[i].strip()
+            attributes[:] = [attr.strip() for attr in attributes]
             attr_set = set(attributes)
-            for vtype in schema:
-                allowlist = set(schema[vtype].keys())
-                if attr_set - allowlist:
+            for vtype, allowlist in schema.items():
+                if not allowlist.issuperset(attr_set):
                     raise ValueError(
                         "Attributes {} are not available for {} type {}.".format(
                             attr_set - allowlist, schema_type, vtype
@@ -440,11 +713,10 @@ class BaseLoader:
                     raise ValueError(
                         "{} type {} is not available in the database.".format(schema_type, vtype)
                     )
-                for i in range(len(attributes[vtype])):
-                    attributes[vtype][i] = attributes[vtype][i].strip()
+                attributes[vtype][:] = [attr.strip() for attr in attributes[vtype]]
                 attr_set = set(attributes[vtype])
-                allowlist = set(schema[vtype].keys())
-                if attr_set - allowlist:
+                allowlist = schema[vtype]
+                if not allowlist.issuperset(attr_set):
                     raise ValueError(
                         "Attributes {} are not available for {} type {}.".format(
                             attr_set - allowlist, schema_type, vtype
@@ -580,6 +852,7 @@ class BaseLoader:
         kafka_consumer: "KafkaConsumer",
         max_wait_time: int = 300
     ) -> NoReturn:
+        # Message values are passed on undecoded, the parser reads the bytes directly
         delivered_batch = 0
         buffer = {}
         wait_time = 0
@@ -598,27 +871,27 @@ class BaseLoader:
                         if key.startswith("vertex"):
                             companion_key = key.replace("vertex", "edge")
                             if companion_key in buffer:
-                                read_task_q.put((message.value.decode("utf-8"), 
+                                read_task_q.put((message.value, 
                                                  buffer[companion_key]))
                                 del buffer[companion_key]
                                 delivered_batch += 1
                             else:
-                                buffer[key] = message.value.decode("utf-8")
+                                buffer[key] = message.value
                         elif key.startswith("edge"):
                             companion_key = key.replace("edge", "vertex")
                             if companion_key in buffer:
                                 read_task_q.put((buffer[companion_key], 
-                                                 message.value.decode("utf-8")))
+                                                 message.value))
                                 del buffer[companion_key]
                                 delivered_batch += 1
                             else:
-                                buffer[key] = message.value.decode("utf-8")
+                                buffer[key] = message.value
                         else:
                             raise ValueError(
                                 "Unrecognized key {} for messages in kafka".format(key)
                             )
                     else:
-                        read_task_q.put(message.value.decode("utf-8"))
+                        read_task_q.put(message.value)
                         delivered_batch += 1
         read_task_q.put(None)
 
@@ -643,6 +916,24 @@ class BaseLoader:
         is_hetero: bool = False,
         callback_fn: Callable = None,
     ) -> NoReturn:
+        parse = BaseLoader._build_parser(
+            in_format = in_format,
+            out_format = out_format,
+            v_in_feats = v_in_feats,
+            v_out_labels = v_out_labels,
+            v_extra_feats = v_extra_feats,
+            v_attr_types = v_attr_types,
+            e_in_feats = e_in_feats,
+            e_out_labels = e_out_labels,
+            e_extra_feats = e_extra_feats,
+            e_attr_types = e_attr_types,
+            add_self_loop = add_self_loop,
+            delimiter = delimiter,
+            reindex = reindex,
+            primary_id = {},
+            is_hetero = is_hetero,
+            callback_fn = callback_fn
+        )
         while not exit_event.is_set():
             raw = in_q.get()
             if raw is None:
@@ -650,25 +941,7 @@ class BaseLoader:
                 out_q.put(None)
                 break
             try:
-                data = BaseLoader._parse_data(
-                    raw = raw,
-                    in_format = in_format,
-                    out_format = out_format,
-                    v_in_feats = v_in_feats,
-                    v_out_labels = v_out_labels,
-                    v_extra_feats = v_extra_feats,
-                    v_attr_types = v_attr_types,
-                    e_in_feats = e_in_feats,
-                    e_out_labels = e_out_labels,
-                    e_extra_feats = e_extra_feats,
-                    e_attr_types = e_attr_types,
-                    add_self_loop = add_self_loop,
-                    delimiter = delimiter,
-                    reindex = reindex,
-                    primary_id = {},
-                    is_hetero = is_hetero,
-                    callback_fn = callback_fn
-                )
+                data = parse(raw)
                 out_q.put(data)
             except Exception as err:
                 warnings.warn("Error parsing a data batch. Set logging level to ERROR for details.")
@@ -679,9 +952,18 @@ class BaseLoader:
                 
             in_q.task_done()
 
+    @staticmethod
+    def _build_parser(**kwargs) -> Callable:
+        """NO DOC: Bind the parsing options of a loader, which are the same for every batch.
+
+        Returns a function of the raw batch only. The type dependent work is cached per
+        attribute layout, so this leaves no per-batch setup in the reader loop.
+        """
+        return partial(BaseLoader._parse_data, **kwargs)
+
     @staticmethod
     def _parse_data(
-        raw: Union[str, Tuple[str, str]],
+        raw: Union[str, bytes, Tuple[str, str], Tuple[bytes, bytes]],
         in_format: 'Literal["vertex", "edge", "graph"]' = "vertex",
         out_format: str = "dataframe",
         v_in_feats: Union[list, dict] = [],
@@ -708,27 +990,25 @@ class BaseLoader:
             """Turn multiple columns of a dataframe into a tensor.
             """        
             x = []
-            for col in attributes:
-                dtype = attr_types[col].lower()
-                if dtype.startswith("str"):
+            for col, dtype, kind, np_dtype in _attr_specs(attributes, attr_types):
+                if kind == "str":
                     raise TypeError(
                         "String type not allowed for input and output features."
                     )
-                if dtype.startswith("list"):
-                    dtype2 = dtype.split(":")[1]
-                    x.append(df[col].str.split(expand=True).to_numpy().astype(dtype2))
-                elif dtype.startswith("set") or dtype.startswith("map") or dtype.startswith("date"):
+                if kind == "list" or kind == "str_list":
+                    x.append(_split_list_column(df[col], np_dtype))
+                elif kind == "map" or kind == "unsupported":
                     raise NotImplementedError(
                         "{} type not supported for input and output features yet.".format(dtype))
-                elif dtype == "bool":
-                    x.append(df[[col]].astype("int8").to_numpy().astype(dtype))
-                elif dtype == "uint":
+                elif kind == "bool":
+                    x.append(df[[col]].astype("int8").to_numpy().astype(np_dtype))
+                elif kind == "uint":
                     # PyTorch only supports uint8. Need to convert it to int.
                     x.append(df[[col]].to_numpy().astype("int"))
                 else:
-                    x.append(df[[col]].to_numpy().astype(dtype))
+                    x.append(df[[col]].to_numpy().astype(np_dtype))
             if mode == "pyg" or mode == "dgl":
-                return torch.tensor(np.hstack(x)).squeeze(dim=1)
+                return _as_tensor(np.hstack(x)).squeeze(dim=1)
             elif mode == "spektral":
                 try:
                     return np.squeeze(np.hstack(x), axis=1) #throws an error if axis isn't 1
@@ -797,9 +1077,8 @@ class BaseLoader:
                     elif target == "vertex":
                         data = graph.ndata
 
-            for col in attr_names:
-                dtype = attr_types[col].lower()
-                if dtype.startswith("str") or dtype.startswith("map"):
+            for col, dtype, kind, np_dtype in _attr_specs(attr_names, attr_types):
+                if kind == "str" or kind == "map":
                     if mode == "dgl":
                         if vetype is None:
                             # Homogeneous graph, add column directly to extra data
@@ -813,9 +1092,8 @@ class BaseLoader:
                             graph.extra_data[vetype][col] = attr_df[col].to_list()
                     elif mode == "pyg" or mode == "spektral":
                         data[col] = attr_df[col].to_list()
-                elif dtype.startswith("list"):
-                    dtype2 = dtype.split(":")[1]
-                    if dtype2.startswith("str"):
+                elif kind == "list" or kind == "str_list":
+                    if kind == "str_list":
                         if mode == "dgl":
                             if vetype is None:
                                 # Homogeneous graph, add column directly to extra data
@@ -831,50 +1109,47 @@ class BaseLoader:
                             data[col] = attr_df[col].str.split().to_list()
                     else:
                         if mode == "pyg" or mode == "dgl":
-                            data[col] = torch.tensor(
-                                attr_df[col]
-                                .str.split(expand=True)
-                                .to_numpy()
-                                .astype(dtype2)
+                            data[col] = _as_tensor(
+                                _split_list_column(attr_df[col], np_dtype)
                             )
                         elif mode == "spektral":
-                            data[col] = attr_df[col].str.split(expand=True).to_numpy().astype(dtype2)
-                elif dtype.startswith("set") or dtype.startswith("date"):
+                            data[col] = _split_list_column(attr_df[col], np_dtype)
+                elif kind == "unsupported":
                     raise NotImplementedError(
                         "{} type not supported for extra features yet.".format(dtype))
-                elif dtype == "bool":
+                elif kind == "bool":
                     if mode == "pyg" or mode == "dgl":
-                        data[col] = torch.tensor(
-                            attr_df[col].astype("int8").astype(dtype)
+                        data[col] = _as_tensor(
+                            attr_df[col].astype("int8").astype(np_dtype)
                         )
                     elif mode == "spektral":
-                        data[col] = attr_df[col].astype("int8").astype(dtype)
-                elif dtype == "uint":
+                        data[col] = attr_df[col].astype("int8").astype(np_dtype)
+                elif kind == "uint":
                     # PyTorch only supports uint8. Need to convert it to int.
                     if mode == "pyg" or mode == "dgl":
-                        data[col] = torch.tensor(
+                        data[col] = _as_tensor(
                             attr_df[col].astype("int")
                         )
                     elif mode == "spektral":
-                        data[col] = attr_df[col].astype(dtype)
+                        data[col] = attr_df[col].astype(np_dtype)
                 else:
                     if mode == "pyg" or mode == "dgl":
-                        data[col] = torch.tensor(
-                            attr_df[col].astype(dtype)
+                        data[col] = _as_tensor(
+                            attr_df[col].astype(np_dtype)
                         )
                     elif mode == "spektral":
-                        data[col] = attr_df[col].astype(dtype)
+                        data[col] = attr_df[col].astype(np_dtype)
         
         # Read in vertex and edge CSVs as dataframes              
         vertices, edges = None, None
+        if is_hetero:
+            # Heterogeneous batches are split by type in Python
+            raw = _decode_batch(raw)
         if in_format == "vertex":
             # String of vertices in format vid,v_in_feats,v_out_labels,v_extra_feats
             if not is_hetero:
                 v_attributes = ["vid"] + v_in_feats + v_out_labels + v_extra_feats
-                v_file = (line.split(delimiter) for line in raw.split('\n') if line)
-                data = pd.DataFrame(v_file, columns=v_attributes)
-                for column in data.columns:
-                    data[column] = pd.to_numeric(data[column], errors="ignore")
+                data = _read_table(raw, v_attributes, delimiter)
                 for v_attr in v_attributes:
                     if v_attr_types.get(v_attr, "") == "MAP":
                         # I am sorry that this is this ugly...
@@ -902,10 +1177,7 @@ class BaseLoader:
                 e_attributes = ["source", "target"] + e_in_feats + e_out_labels + e_extra_feats
                 #file = "\n".join(x for x in raw.split("\n") if x.strip())
                 #data = pd.read_table(io.StringIO(file), header=None, names=e_attributes, sep=delimiter)
-                e_file = (line.split(delimiter) for line in raw.split('\n') if line)
-                data = pd.DataFrame(e_file, columns=e_attributes)
-                for column in data.columns:
-                    data[column] = pd.to_numeric(data[column], errors="ignore")
+                data = _read_table(raw, e_attributes, delimiter)
                 for e_attr in e_attributes:
                     if e_attr_types.get(e_attr, "") == "MAP":
                         # I am sorry that this is this ugly...
@@ -934,11 +1206,12 @@ class BaseLoader:
             if not is_hetero:
                 v_attributes = ["vid"] + v_in_feats + v_out_labels + v_extra_feats
                 e_attributes = ["source", "target"] + e_in_feats + e_out_labels + e_extra_feats
+                e_future = None
+                if len(v_file) + len(e_file) > PARALLEL_PARSE_THRESHOLD:
+                    # Parse the edges while the vertices are parsed here
+                    e_future = _get_parse_pool().submit(_read_table, e_file, e_attributes, delimiter)
                 #file = "\n".join(x for x in v_file.split("\n") if x.strip())
-                v_file = (line.split(delimiter) for line in v_file.split('\n') if line)
-                vertices = pd.DataFrame(v_file, columns=v_attributes)
-                for column in vertices.columns:
-                    vertices[column] = pd.to_numeric(vertices[column], errors="ignore")
+                vertices = _read_table(v_file, v_attributes, delimiter)
                 for v_attr in v_extra_feats:
                     if v_attr_types[v_attr] == "MAP":
                         # I am sorry that this is this ugly...
@@ -948,11 +1221,11 @@ class BaseLoader:
                     vertices = vertices.merge(id_map.astype({"vid": vertices["vid"].dtype}), on="vid")
                     v_extra_feats.append("primary_id")
                 #file = "\n".join(x for x in e_file.split("\n") if x.strip())
-                e_file = (line.split(delimiter) for line in e_file.split('\n') if line)
                 #edges = pd.read_table(io.StringIO(file), header=None, names=e_attributes, dtype="object", sep=delimiter)
-                edges = pd.DataFrame(e_file, columns=e_attributes)
-                for column in edges.columns:
-                    edges[column] = pd.to_numeric(edges[column], errors="ignore")
+                if e_future is not None:
+                    edges = e_future.result()
+                else:
+                    edges = _read_table(e_file, e_attributes, delimiter)
                 for e_attr in e_attributes:
                     if e_attr_types.get(e_attr, "") == "MAP":
                         # I am sorry that this is this ugly...
@@ -1077,7 +1350,8 @@ class BaseLoader:
                 edgelist = edges[["source", "target"]]
 
             if mode == "dgl" or mode == "pyg":
-                edgelist = torch.tensor(edgelist.to_numpy().T, dtype=torch.long)
+                # (2, n_edges) in one contiguous int64 block
+                edgelist = _as_tensor(edgelist.to_numpy(dtype=np.int64).T)
                 if mode == "dgl":
                     data = dgl.graph(data=(edgelist[0], edgelist[1]))
                     if add_self_loop:
@@ -1163,7 +1437,7 @@ class BaseLoader:
                 for etype in edges:
                     edgelist[etype] = edges[etype][["source", "target"]]
             for etype in edges:
-                edgelist[etype] = torch.tensor(edgelist[etype].to_numpy().T, dtype=torch.long)
+                edgelist[etype] = _as_tensor(edgelist[etype].to_numpy(dtype=np.int64).T)
             if mode == "dgl":
                 data = dgl.heterograph({
                     (e_attr_types[etype]["FromVertexTypeName"], etype, e_attr_types[etype]["ToVertexTypeName"]): (edgelist[etype][0], edgelist[etype][1]) for etype in edgelist})
@@ -1282,7 +1556,7 @@ class BaseLoader:
         # Create task and result queues
         self._request_task_q = Queue()
         self._read_task_q = Queue()
-        self._data_q = Queue(self._buffer_size)
+        self._data_q = _data_queue(self._buffer_size)
         self._exit_event = Event()
 
         # Start requesting thread. Finish with your logic.
@@ -1325,7 +1599,14 @@ class BaseLoader:
         if not self._data_q:
             self._iterator = False
             raise StopIteration
-        data = self._data_q.get()
+        if not self._pending:
+            if isinstance(self._data_q, SPSCQueue):
+                # Held batches keep their slots in the queue, so the buffer size still bounds
+                # the number of batches in memory
+                self._pending.extend(self._data_q.get_many(self._data_q.maxsize))
+            else:
+                self._pending.append(self._data_q.get())
+        data = self._pending.popleft()
         if data is None:
             self._iterator = False
             raise StopIteration
@@ -1366,6 +1647,7 @@ class BaseLoader:
                     self._data_q.get(block=False)
                 except Empty:
                     break
+        self._pending.clear()
         if self._requester:
             self._requester.join()
         if self._downloader:
@@ -1790,7 +2072,7 @@ class NeighborLoader(BaseLoader):
     def _start(self) -> None:
         # Create task and result queues
         self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._data_q = _data_queue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(True, "both")
@@ -2170,7 +2452,7 @@ class EdgeLoader(BaseLoader):
     def _start(self) -> None:
         # Create task and result queues
         self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._data_q = _data_queue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(False, "edge")
@@ -2474,7 +2756,7 @@ class VertexLoader(BaseLoader):
     def _start(self) -> None:
         # Create task and result queues
         self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._data_q = _data_queue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(False, "vertex")
@@ -2839,7 +3121,7 @@ class GraphLoader(BaseLoader):
     def _start(self) -> None:
         # Create task and result queues
         self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._data_q = _data_queue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(True, "both")
@@ -3196,7 +3478,7 @@ class EdgeNeighborLoader(BaseLoader):
     def _start(self) -> None:
         # Create task and result queues
         self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._data_q = _data_queue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(True, "both")
@@ -3666,7 +3948,7 @@ class NodePieceLoader(BaseLoader):
     def _start(self) -> None:
         # Create task and result queues
         self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._data_q = _data_queue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(False, "vertex")
@@ -4100,7 +4382,7 @@ class HGTLoader(BaseLoader):
     def _start(self) -> None:
         # Create task and result queues
         self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._data_q = _data_queue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(True, "both")
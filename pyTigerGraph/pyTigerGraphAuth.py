@@ -13,8 +13,12 @@ from typing import Union, Tuple, Dict
 from pyTigerGraph.common.auth import (
     _parse_get_secrets,
     _parse_create_secret,
+    _prep_drop_secret,
     _prep_token_request,
-    _parse_token_response
+    _parse_token_response,
+    _get_cached_token,
+    _cache_token,
+    _invalidate_cached_tokens
 )
 from pyTigerGraph.common.exception import TigerGraphException
 from pyTigerGraph.pyTigerGraphGSQL import pyTigerGraphGSQL
@@ -44,8 +48,8 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
             SHOW SECRET""".format(self.graphname), )
         ret = _parse_get_secrets(res)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getSecrets")
 
         return ret
@@ -84,7 +88,7 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
             should not be necessary and should not be executable by generic users.
         """
         logger.info("entry: createSecret")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         res = self.gsql("""
@@ -93,17 +97,17 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
         secret = _parse_create_secret(
             res, alias=alias, withAlias=withAlias)
 
-        # Alias was not provided, let's find out the autogenerated one
+        # Alias was not provided and the response did not include it, let's find out the autogenerated one
         # done in createSecret since need to call self.getSecrets which is a possibly async function
-        if withAlias and not alias:
+        if withAlias and not isinstance(secret, dict):
             masked = secret[:3] + "****" + secret[-3:]
             secs = self.getSecrets()
             for (a, s) in secs.items():
                 if s == masked:
                     secret = {a: secret}
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(secret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", secret)
         logger.info("exit: createSecret")
 
         return secret
@@ -123,22 +127,16 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
                 `ignoreErrors` is `True`). Re-raises other exceptions.
         """
         logger.info("entry: dropSecret")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
-        if isinstance(alias, str):
-            alias = [alias]
-        cmd = """
-            USE GRAPH {}""".format(self.graphname)
-        for a in alias:
-            cmd += """
-                DROP SECRET {}""".format(a)
+        cmd = _prep_drop_secret(self.graphname, alias)
         res = self.gsql(cmd)
         if "Failed to drop secrets" in res and not ignoreErrors:
             raise TigerGraphException(res)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: dropSecret")
 
         return res
@@ -147,7 +145,7 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
         method, url, alt_url, authMode, data, alt_data = _prep_token_request(self.restppUrl,
                                                                              self.gsUrl,
                                                                              self.graphname,
-                                                                             self.version,
+                                                                             self._is_pre_35,
                                                                              secret,
                                                                              lifetime,
                                                                              token)
@@ -166,24 +164,34 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
             if _method:
                 method = _method
 
-            # Try using TG 3.x endpoint first, if url not found then try <4.1 endpoint
-            try:
-                res = self._req(
-                        method, alt_url, authMode=authMode, data=alt_data, resKey=None)
-                mainVer = 3
-            except:
+            # (url, data, jsonData) of the token endpoint of each major version
+            endpoints = {3: (alt_url, alt_data, False), 4: (url, data, True)}
+            if self._token_endpoint_ver:
+                # The endpoint that worked before is used directly
+                mainVer = self._token_endpoint_ver
+                url, data, jsonData = endpoints[mainVer]
+                res = self._req(method, url, authMode=authMode,
+                                data=data, resKey=None, jsonData=jsonData)
+            else:
+                # Try using TG 3.x endpoint first, if url not found then try <4.1 endpoint
                 try:
-                    res = self._req(method, url, authMode=authMode,
-                                data=data, resKey=None, jsonData=True)
-                    mainVer = 4
-                except requests.exceptions.HTTPError as e:
-                    if e.response.status_code == 404:
-                        raise TigerGraphException(
-                            "Error requesting token. Check if the connection's graphname is correct and that REST authentication is enabled.",
-                            404
-                        )
-                    else:
-                        raise e
+                    res = self._req(
+                            method, alt_url, authMode=authMode, data=alt_data, resKey=None)
+                    mainVer = 3
+                except:
+                    try:
+                        res = self._req(method, url, authMode=authMode,
+                                    data=data, resKey=None, jsonData=True)
+                        mainVer = 4
+                    except requests.exceptions.HTTPError as e:
+                        if e.response.status_code == 404:
+                            raise TigerGraphException(
+                                "Error requesting token. Check if the connection's graphname is correct and that REST authentication is enabled.",
+                                404
+                            )
+                        else:
+                            raise e
+                self._token_endpoint_ver = mainVer
 
         # uses mainVer instead of _versionGreaterThan4_0 since you need a token for verson checking
         return res, mainVer
@@ -198,6 +206,9 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
         will be raised.
         See https://docs.tigergraph.com/admin/admin-guide/user-access-management/user-privileges-and-authentication#rest-authentication
 
+        A token requested earlier on this connection with the same secret, graph and lifetime is
+        reused until shortly before it expires, instead of requesting a new one.
+
         Args:
             secret (str, Optional):
                 The secret (string) generated in GSQL using `CREATE SECRET`.
@@ -228,15 +239,25 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
             - `POST /gsql/v1/tokens` (In TigerGraph versions 4.x)
         """
         logger.info("entry: getToken")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
-        res, mainVer = self._token(secret, lifetime)
-        token, auth_header = _parse_token_response(res,
-                                                   setToken,
-                                                   mainVer,
-                                                   self.base64_credential
-                                                )
+        key = (secret, self.graphname, lifetime)
+        token = _get_cached_token(self._token_cache, key)
+        if token is None:
+            res, mainVer = self._token(secret, lifetime)
+            token, auth_header = _parse_token_response(res,
+                                                       setToken,
+                                                       mainVer,
+                                                       self.base64_credential
+                                                    )
+            _cache_token(self._token_cache, key, token, res, lifetime)
+        else:
+            if setToken:
+                auth_header = self._bearer_header(token[0] if isinstance(token, tuple) else token)
+            else:
+                auth_header = self._basic_header
+
         self.apiToken = token
         self.authHeader = auth_header
 
@@ -283,19 +304,24 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
                 See https://docs.tigergraph.com/tigergraph-server/current/api/built-in-endpoints#_refresh_a_token
         """
         logger.info("entry: refreshToken")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
-
+        # The version check is cached, so unsupported versions fail before any other work
         if self._version_greater_than_4_0():
             logger.info("exit: refreshToken")
             raise TigerGraphException(
                 "Refreshing tokens is only supported on versions of TigerGraph <= 4.0.0.", 0)
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
+
         if not token:
             token = self.apiToken
+        _invalidate_cached_tokens(self._token_cache, token)
         res, mainVer = self._token(secret, lifetime, token, "PUT")
 
-        newToken = _parse_token_response(res, setToken, mainVer, self.base64_credential)
+        newToken, auth_header = _parse_token_response(res, setToken, mainVer, self.base64_credential)
+        if setToken:
+            self.apiToken = newToken
+            self.authHeader = auth_header
 
         logger.info("exit: refreshToken")
 
@@ -333,11 +359,12 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
         """
         if not token:
             token = self.apiToken
+        _invalidate_cached_tokens(self._token_cache, token)
         res, _ = self._token(secret, None, token, "DELETE")
 
         if not res["error"] or (res["code"] == "REST-3300" and skipNA):
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(True))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", True)
             logger.info("exit: deleteToken")
 
             return True
@@ -28,11 +28,15 @@ import re
 import warnings
 import requests
 
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Union
 from urllib.parse import urlparse
 
 from pyTigerGraph.common.exception import TigerGraphException
-from pyTigerGraph.common.base import PyTigerGraphCore
+from pyTigerGraph.common.base import SOCKET_OPTIONS, PyTigerGraphCore, _parse_version
+from pyTigerGraph.common.util import _json_loads
 
 
 def excepthook(type, value, traceback):
@@ -49,6 +53,33 @@ def excepthook(type, value, traceback):
 logger = logging.getLogger(__name__)
 
 
+class _SocketOptionsAdapter(HTTPAdapter):
+    """NO DOC"""
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _new_session() -> requests.Session:
+    """NO DOC
+
+    Creates the HTTP session shared by all requests of a connection, so that TCP connections and
+    TLS sessions are kept alive and reused between calls.
+    """
+    session = requests.Session()
+    # Cookies set by the server are not sent back, so requests stay independent of each other as
+    # with `requests.request()`
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    # Only failed connection attempts are retried, a request the server may have received
+    # (e.g. a query run over GET) is never sent again
+    adapter = _SocketOptionsAdapter(pool_connections=4, pool_maxsize=16,
+                                    max_retries=Retry(total=2, connect=2, read=False, status=False,
+                                                      other=False, backoff_factor=0.1))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class pyTigerGraphBase(PyTigerGraphCore, object):
     def __init__(self, host: str = "http://127.0.0.1", graphname: str = "MyGraph",
                  gsqlSecret: str = "", username: str = "tigergraph", password: str = "tigergraph",
@@ -103,7 +134,7 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
 
         """
         logger.info("entry: __init__")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         inputHost = urlparse(host)
@@ -124,11 +155,25 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
 
         self.jwtToken = jwtToken
         self.apiToken = apiToken
+        # Tokens requested by getToken(), keyed by (secret, graphname, lifetime)
+        self._token_cache = {}
+        # Major version (3 or 4) of the token endpoint that last answered, see _token()
+        self._token_endpoint_ver = None
+        # Graphs found by check_exist_graphs(), mapped to when that result expires
+        self._graph_exists_cache = {}
+        # (graphname, expiry, {name: fields}) of the last UDT list fetched for getUDT()/getUDTs()
+        self._udt_cache = None
         self.base64_credential = base64.b64encode(
             "{0}:{1}".format(self.username, self.password).encode("utf-8")).decode("utf-8")
+        # Authorization headers are built once and shared by requests, see _bearer_header()
+        self._basic_header = {"Authorization": "Basic {0}".format(self.base64_credential)}
+        self._bearer = (None, None)
 
         self.authHeader = self._set_auth_header()
 
+        # Whether the database version is greater than 4.0, see _version_greater_than_4_0()
+        self._version_gt_4_0 = None
+
         # TODO Eliminate version and use gsqlVersion only, meaning TigerGraph server version
         if gsqlVersion:
             self.version = gsqlVersion
@@ -168,6 +213,8 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
             self.certPath = certPath
         self.sslPort = str(sslPort)
 
+        self._session = _new_session()
+
         # TODO Remove gcp parameter
         if gcp:
             warnings.warn("The `gcp` parameter is deprecated.",
@@ -229,11 +276,11 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
     def _set_auth_header(self):
         """Set the authentication header based on available tokens or credentials."""
         if self.jwtToken:
-            return {"Authorization": "Bearer " + self.jwtToken}
+            return self._bearer_header(self.jwtToken)
         elif self.apiToken:
-            return {"Authorization": "Bearer " + self.apiToken}
+            return self._bearer_header(self.apiToken)
         else:
-            return {"Authorization": "Basic {0}".format(self.base64_credential)}
+            return self._basic_header
 
     def _verify_jwt_token_support(self):
         try:
@@ -267,6 +314,11 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
 
         logger.info("exit: __init__")
 
+    def __del__(self):
+        session = self.__dict__.get("_session")
+        if session is not None:
+            session.close()
+
     def _req(self, method: str, url: str, authMode: str = "token", headers: dict = None,
              data: Union[dict, list, str] = None, resKey: str = "results", skipCheck: bool = False,
              params: Union[dict, list, str] = None, strictJson: bool = True, jsonData: bool = False,
@@ -303,16 +355,16 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
             authMode, headers, url, method, data)
 
         if jsonData:
-            res = requests.request(
+            res = self._session.request(
                 method, url, headers=_headers, json=_data, params=params, verify=verify)
         else:
-            res = requests.request(
+            res = self._session.request(
                 method, url, headers=_headers, data=_data, params=params, verify=verify)
 
         try:
             if not skipCheck and not (200 <= res.status_code < 300):
                 try:
-                    self._error_check(json.loads(res.text))
+                    self._error_check(_json_loads(res))
                 except json.decoder.JSONDecodeError:
                     # could not parse the res text (probably returned an html response)
                     pass
@@ -332,17 +384,17 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
                     url = newRestppUrl + '/' + \
                         '/'.join(url.split(':')[2].split('/')[1:])
                 if jsonData:
-                    res = requests.request(
+                    res = self._session.request(
                         method, url, headers=_headers, json=_data, params=params, verify=verify)
                 else:
-                    res = requests.request(
+                    res = self._session.request(
                         method, url, headers=_headers, data=_data, params=params, verify=verify)
 
                 # Run error check if there might be an error before raising for status
                 # raising for status gives less descriptive error message
                 if not skipCheck and not (200 <= res.status_code < 300) and res.status_code != 404:
                     try:
-                        self._error_check(json.loads(res.text))
+                        self._error_check(_json_loads(res))
                     except json.decoder.JSONDecodeError:
                         # could not parse the res text (probably returned an html response)
                         pass
@@ -377,14 +429,14 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
             The (relevant part of the) response from the request (as a dictionary).
        """
         logger.info("entry: _get")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         res = self._req("GET", url, authMode, headers, None,
                         resKey, skipCheck, params, strictJson)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: _get")
 
         return res
@@ -415,14 +467,14 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
             The (relevant part of the) response from the request (as a dictionary).
         """
         logger.info("entry: _post")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         res = self._req("POST", url, authMode, headers, data,
                         resKey, skipCheck, params, jsonData=jsonData)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: _post")
 
         return res
@@ -440,14 +492,14 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
             The response from the request (as a dictionary).
         """
         logger.info("entry: _put")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         res = self._req("PUT", url, authMode, data=data,
                         resKey=resKey, jsonData=jsonData)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: _put")
 
         return res
@@ -465,14 +517,14 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
             The response from the request (as a dictionary).
         """
         logger.info("entry: _delete")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         res = self._req("DELETE", url, authMode, data=data,
                         resKey=resKey, jsonData=jsonData)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: _delete")
 
         return res
@@ -494,14 +546,14 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_show_component_versions[Show component versions]
         """
         logger.info("entry: getVersion")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
         response = self._get(self.restppUrl+"/version",
                              strictJson=False, resKey="message")
         components = self._parse_get_version(response, raw)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(components))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", components)
         logger.info("exit: getVersion")
         return components
 
@@ -523,13 +575,13 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
             `TigerGraphException` if invalid/non-existent component is specified.
         """
         logger.info("entry: getVer")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
         version = self.getVersion()
         ret = self._parse_get_ver(version, component, full)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVer")
 
         return ret
@@ -551,10 +603,11 @@ class pyTigerGraphBase(PyTigerGraphCore, object):
     def _version_greater_than_4_0(self) -> bool:
         """Gets if the TigerGraph database version is greater than 4.0 using gerVer().
 
+        The version is only requested from the database the first time.
+
         Returns:
             Boolean of whether databse version is greater than 4.0.
         """
-        version = self.getVer().split('.')
-        if version[0] >= "4" and version[1] > "0":
-            return True
-        return False
\ No newline at end of file
+        if self._version_gt_4_0 is None:
+            self._version_gt_4_0 = _parse_version(self.getVer())[:2] > (4, 0)
+        return self._version_gt_4_0
\ No newline at end of file
@@ -4,9 +4,18 @@ Ingest stock datasets into a TigerGraph database.
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object]. 
 """
 import logging
+import time
+
+import requests
 
 from pyTigerGraph.datasets import Datasets
-from pyTigerGraph.common.dataset import _parse_ingest_dataset
+from pyTigerGraph.common.exception import TigerGraphException
+from pyTigerGraph.common.dataset import (
+    GRAPH_EXISTS_TTL,
+    _parse_check_exist_graphs,
+    _parse_ingest_dataset,
+    _prep_check_exist_graphs
+)
 from pyTigerGraph.pyTigerGraphAuth import pyTigerGraphAuth
 
 logger = logging.getLogger(__name__)
@@ -32,7 +41,7 @@ class pyTigerGraphDataset(pyTigerGraphAuth):
                 when auth token is enabled for the database. Defaults to False.
         """
         logger.info("entry: ingestDataset")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if not dataset.ingest_ready:
@@ -45,7 +54,7 @@ class pyTigerGraphDataset(pyTigerGraphAuth):
             # ))
             self.graphname = dataset.name
             if getToken:
-                self.getToken(self.createSecret())
+                self._acquireToken()
             print(
                 "A graph with name {} already exists in the database. "
                 "Skip ingestion.".format(dataset.name)
@@ -74,18 +83,46 @@ class pyTigerGraphDataset(pyTigerGraphAuth):
         print("---- Ingesting data ----", flush=True)
         self.graphname = dataset.name
         if getToken:
-            self.getToken(self.createSecret())
+            self._acquireToken()
 
-        responses = []
-        for resp in dataset.run_load_job(self):
-            responses.append(resp)
-
-        _parse_ingest_dataset(responses, cleanup, dataset)
+        _parse_ingest_dataset(dataset.run_load_job(self), cleanup, dataset)
 
         print("---- Finished ingestion ----", flush=True)
         logger.info("exit: ingestDataset")
 
+    def _acquireToken(self) -> None:
+        "NO DOC"
+        # Versions before 3.5 only issue tokens for a secret
+        if self._is_pre_35:
+            self.getToken(self.createSecret())
+            return
+        # Otherwise the version can't be checked before there is a token, so try the user's
+        # credentials first (>4.0) and create a secret only if the server doesn't accept them
+        try:
+            self.getToken()
+        except (TigerGraphException, requests.exceptions.RequestException):
+            self.getToken(self.createSecret())
+
     def check_exist_graphs(self, name: str) -> bool:
         "NO DOC"
-        resp = self.gsql("ls")
-        return "Graph {}".format(name) in resp
+        if self._graph_exists_cache.get(name, 0) > time.time():
+            return True
+
+        exists = None
+        # Checking the version needs a token, without one the probe would only fail
+        if self._version_gt_4_0 is not None or self.apiToken or self.jwtToken:
+            try:
+                res = self._get(
+                    _prep_check_exist_graphs(self.gsUrl, name, self._version_greater_than_4_0()),
+                    authMode="pwd", resKey=None, skipCheck=True)
+                exists = _parse_check_exist_graphs(res)
+            except (TigerGraphException, requests.exceptions.RequestException, ValueError):
+                # ValueError covers responses that are not JSON
+                pass
+        if exists is None:
+            resp = self.gsql("ls")
+            exists = "Graph {}".format(name) in resp
+
+        if exists:
+            self._graph_exists_cache[name] = time.time() + GRAPH_EXISTS_TTL
+        return exists
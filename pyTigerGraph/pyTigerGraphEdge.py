@@ -56,15 +56,15 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             The list of edge types defined in the current graph.
         """
         logger.info("entry: getEdgeTypes")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = []
         for et in self.getSchema(force=force)["EdgeTypes"]:
             ret.append(et["Name"])
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeTypes")
 
         return ret
@@ -83,13 +83,13 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             The metadata of the edge type.
         """
         logger.info("entry: getEdgeType")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         for et in self.getSchema(force=force)["EdgeTypes"]:
             if et["Name"] == edgeType:
-                if logger.level == logging.DEBUG:
-                    logger.debug("return: " + str(et))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("return: %s", et)
                 logger.info("exit: getEdgeType (found)")
 
                 return et
@@ -115,7 +115,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             and it is a string.
         """
         logger.info("entry: getAttributes")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         et = self.getEdgeType(edgeType)
@@ -125,8 +125,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             ret.append(
                 (at["AttributeName"], _get_attr_type(at["AttributeType"])))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getAttributes")
 
         return ret
@@ -156,7 +156,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 valid/defined.
         """
         logger.info("entry: getEdgeSourceVertexType")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         edgeTypeDetails = self.getEdgeType(edgeType)
@@ -187,7 +187,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 the individual source/target pairs to find out which combinations are valid/defined.
         """
         logger.info("entry: getEdgeTargetVertexType")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         edgeTypeDetails = self.getEdgeType(edgeType)
@@ -205,13 +205,13 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             `True`, if the edge is directed.
         """
         logger.info("entry: isDirected")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = self.getEdgeType(edgeType)["IsDirected"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: isDirected")
 
         return ret
@@ -227,7 +227,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             The name of the reverse edge, if it was defined.
         """
         logger.info("entry: getReverseEdge")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if not self.isDirected(edgeType):
@@ -240,8 +240,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         if "REVERSE_EDGE" in config:
             ret = config["REVERSE_EDGE"]
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", ret)
             logger.info("exit: getReverseEdge (reverse edge found)")
 
             return ret
@@ -262,14 +262,14 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             `True`, if the edge can have multiple instances between the same pair of vertices.
         """
         logger.info("entry: isMultiEdge")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         et = self.getEdgeType(edgeType)
         ret = ("DiscriminatorCount" in et) and et["DiscriminatorCount"] > 0
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: isMultiEdge")
 
         return ret
@@ -285,7 +285,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             A list of (attribute_name, attribute_type) tuples.
         """
         logger.info("entry: getDiscriminators")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         et = self.getEdgeType(edgeType)
@@ -296,8 +296,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 ret.append(
                     (at["AttributeName"], _get_attr_type(at["AttributeType"])))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getDiscriminators")
 
         return ret
@@ -349,7 +349,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 See https://docs.tigergraph.com/tigergraph-server/current/api/built-in-endpoints
         """
         logger.info("entry: getEdgeCountFrom")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url, data = _prep_get_edge_count_from(restppUrl=self.restppUrl,
@@ -366,8 +366,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             res = self._req("GET", url)
         ret = _parse_get_edge_count_from(res, edgeType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeCountFrom  (multiple edge types)")
 
         return ret
@@ -392,14 +392,14 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             A dictionary of `edge_type: edge_count` pairs.
         """
         logger.info("entry: getEdgeCount")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = self.getEdgeCountFrom(edgeType=edgeType, sourceVertexType=sourceVertexType,
                                     targetVertexType=targetVertexType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeCount")
 
         return ret
@@ -450,7 +450,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             parameters and functionality.
         """
         logger.info("entry: upsertEdge")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         data = _prep_upsert_edge(sourceVertexType,
@@ -486,8 +486,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             params=params,
         )[0]["accepted_edges"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertEdge")
 
         return ret
@@ -541,7 +541,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         """
 
         logger.info("entry: upsertEdges")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         """
@@ -601,8 +601,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             self.restppUrl + "/graph/" + self.graphname, data=data, params=params
         )[0]["accepted_edges"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertEdges")
 
         return ret
@@ -643,7 +643,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             The number of edges upserted.
         """
         logger.info("entry: upsertEdgeDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         json_up = _prep_upsert_edge_dataframe(df, from_id, to_id, attributes)
@@ -673,8 +673,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             atomic=atomic
         )
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertEdgeDataFrame")
 
         return ret
@@ -731,7 +731,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#list-edges-of-a-vertex
         """
         logger.info("entry: getEdges")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         # TODO Change sourceVertexId to sourceVertexIds and allow passing both str and list<str> as
@@ -755,8 +755,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         elif fmt == "df":
             ret = _eS2DF(ret, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdges")
 
         return ret
@@ -799,14 +799,14 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             JSON or pandas DataFrame.
         """
         logger.info("entry: getEdgesDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = self.getEdges(sourceVertexType, sourceVertexId, edgeType, targetVertexType,
                             targetVertexId, select, where, limit, sort, fmt="df", timeout=timeout)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgesDataFrame")
 
         return ret
@@ -851,7 +851,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             DataFrame.
         """
         logger.info("entry: getEdgesByType")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if not edgeType:
@@ -873,8 +873,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         elif fmt == "df":
             ret = _eS2DF(ret, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: _upsertAttrs")
 
         return ret
@@ -899,7 +899,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#run-built-in-functions-on-graph
         """
         logger.info("entry: getEdgeStats")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ets = []
@@ -924,8 +924,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             responses.append((et, res))
         ret = _parse_get_edge_stats(responses, skipNA)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeStats")
 
         return ret
@@ -968,7 +968,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#delete-an-edge
         """
         logger.info("entry: delEdges")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url = _prep_del_edges(self.restppUrl,
@@ -987,8 +987,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         for r in res:
             ret[r["e_type"]] = r["deleted_edges"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: delEdges")
 
         return ret
@@ -1008,13 +1008,13 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             The edge set as a pandas DataFrame.
         """
         logger.info("entry: edgeSetToDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = _eS2DF(edgeSet, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: edgeSetToDataFrame")
 
         return ret
\ No newline at end of file
@@ -84,7 +84,7 @@ class pyTigerGraphGSQL(pyTigerGraphBase):
             - `PUT /gsqlserver/gsql/userdefinedfunction?filename={ExprFunctions or ExprUtil}"` (In TigerGraph versions 3.x)
         """
         logger.info("entry: installUDF")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if ExprFunctions:
@@ -134,7 +134,7 @@ class pyTigerGraphGSQL(pyTigerGraphBase):
                 logger.error("Failed to install ExprUtil")
                 raise TigerGraphException(res["message"])
 
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("return: 0")
         logger.info("exit: installUDF")
 
@@ -162,7 +162,7 @@ class pyTigerGraphGSQL(pyTigerGraphBase):
             - `GET /gsql/v1/udt/files/{ExprFunctions or ExprUtil}` (In TigerGraph versions 4.x)
         """
         logger.info("entry: getUDF")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         urls, alt_urls = _prep_get_udf(
@@ -65,7 +65,8 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: runLoadingJobWithDataFrame")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         if columns is None:
             data = df.to_csv(sep = sep, header=False)
@@ -112,7 +113,8 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: runLoadingJobWithFile")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         data = _prep_run_loading_job_with_file(filePath)
         res = self.runLoadingJobWithData(data, fileTag, jobName, sep, eol, timeout, sizeLimit)
@@ -155,7 +157,8 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: runLoadingJobWithData")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         if not data or not jobName or not fileTag:
             # invalid inputs
@@ -180,7 +183,7 @@ class pyTigerGraphLoading(pyTigerGraphBase):
             res = self._req("POST", self.restppUrl + "/ddl/" + self.graphname, params=params, data=data,
                             headers={"RESPONSE-LIMIT": str(sizeLimit), "GSQL-TIMEOUT": str(timeout)})
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: runLoadingJobWithData")
 
         return res
@@ -208,13 +211,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: getLoadingJobs")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_loading_job_url(self.gsUrl, self.graphname)
 
         res = self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: getLoadingJobs")
 
         return res
@@ -232,13 +236,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: createLoadingJob")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_loading_job_url(self.gsUrl, self.graphname)
 
         res = self._req("POST", url, data=job_definition)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: createLoadingJob")
 
         return res
@@ -256,13 +261,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: updateLoadingJob")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_loading_job_url(self.gsUrl, self.graphname)
 
         res = self._req("PUT", url, data=job_definition)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: updateLoadingJob")
 
         return res
@@ -282,13 +288,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: getLoadingJobInfo")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_loading_job_info(self.gsUrl, jobName, self.graphname, verbose)
 
         res = self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: getLoadingJobInfo")
 
         return res
@@ -321,13 +328,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
                 See xref:tigergraph-server:API:gsql-endpoints.adoc#_run_loading_job[Run a loading job]
         """
         logger.info("entry: runLoadingJob")
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url, data = _prep_run_loading_job(self.gsUrl, self.graphname, jobName, data_source_config, sys_data_root, verbose, dryrun, interval, maxNumError, maxPercentError)
 
         res = self._req("POST", url, data=data)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: runLoadingJob")
 
         return res
@@ -345,13 +353,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: dropLoadingJob")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_loading_job_info(self.gsUrl, jobName, self.graphname)
 
         res = self._req("DELETE", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: dropLoadingJob")
 
         return res
@@ -371,13 +380,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: abortLoadingJobs")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_abort_loading_jobs(self.gsUrl, self.graphname, jobIds, pauseJob)
 
         res = self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: abortLoadingJobs")
 
         return res
@@ -397,13 +407,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: abortLoadingJob")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_abort_one_loading_job(self.gsUrl, self.graphname, jobId, pauseJob)
 
         res = self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: abortLoadingJob")
 
         return res
@@ -421,13 +432,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: resumeLoadingJob")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_resume_loading_job(self.gsUrl, jobId)
 
         res = self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: resumeLoadingJob")
 
         return res
@@ -445,13 +457,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: getLoadingJobsStatus")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_get_loading_jobs_status(self.gsUrl, self.graphname, jobIds)
 
         res = self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: getLoadingJobsStatus")
 
         return res
@@ -469,13 +482,14 @@ class pyTigerGraphLoading(pyTigerGraphBase):
         """
         logger.info("entry: getLoadingJobStatus")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_get_loading_job_status(self.gsUrl, self.graphname, jobId)
 
         res = self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: getLoadingJobStatus")
 
         return res
\ No newline at end of file
@@ -34,10 +34,10 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             queryName (str):
                 Name of the query to get metadata of.
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: showQuery")
         res = self.gsql("USE GRAPH "+self.graphname+" SHOW QUERY "+queryName)
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("exit: showQuery")
         return res
 
@@ -55,7 +55,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc_get_query_metadata
             - `POST /gsql/v1/queries/signature` (In TigerGraph versions 4.x)
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: getQueryMetadata")
         if self._version_greater_than_4_0():
             params = {"graph": self.graphname, "queryName": queryName}
@@ -66,7 +66,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             res = self._get(self.gsUrl+"/gsqlserver/gsql/queryinfo",
                             params=params, authMode="pwd", resKey="")
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: getQueryMetadata")
             return res
         else:
@@ -90,14 +90,14 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
         TODO Return with query name as key rather than REST endpoint as key?
         """
         logger.info("entry: getInstalledQueries")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = self.getEndpoints(dynamic=True)
         ret = _parse_get_installed_queries(fmt, ret)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getInstalledQueries")
 
         return ret
@@ -176,7 +176,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_an_installed_query_post[Run an installed query (POST)]
         """
         logger.info("entry: runInstalledQuery")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         headers, res_key = _prep_run_installed_query(timeout=timeout, sizeLimit=sizeLimit, runAsync=runAsync,
@@ -185,8 +185,8 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             ret = self._req("POST", self.restppUrl + "/query/" + self.graphname + "/" + queryName,
                             data=params, headers=headers, resKey=res_key, jsonData=True)
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", ret)
             logger.info("exit: runInstalledQuery (POST)")
 
             return ret
@@ -196,8 +196,8 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             ret = self._req("GET", self.restppUrl + "/query/" + self.graphname + "/" + queryName,
                             params=params, headers=headers, resKey=res_key)
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", ret)
             logger.info("exit: runInstalledQuery (GET)")
 
             return ret
@@ -280,7 +280,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             plus parameters if applicable to interpreted queries (see runInstalledQuery() above)
         """
         logger.info("entry: runInterpretedQuery")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         queryText = queryText.replace("$graphname", self.graphname)
@@ -296,8 +296,8 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             ret = self._post(self.gsUrl + "/gsqlserver/interpreted_query", data=queryText,
                              params=params, authMode="pwd")
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: runInterpretedQuery")
 
         return ret
@@ -305,12 +305,12 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
     def getRunningQueries(self) -> dict:
         """Reports the statistics of currently running queries on the graph.
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: getRunningQueries")
         res = self._get(self.restppUrl+"/showprocesslist/" +
                         self.graphname, resKey="")
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: getRunningQueries")
             return res
         else:
@@ -325,7 +325,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
                 The ID(s) of the query(s) to abort. If set to "all", it will abort all running queries.
             url
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: abortQuery")
         params = {}
         if request_id:
@@ -335,7 +335,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
         res = self._get(self.restppUrl+"/abortquery/" +
                         self.graphname, params=params, resKey="")
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: abortQuery")
             return res
         else:
@@ -408,7 +408,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
                 obj["x_sources"] = [src]
 
         logger.info("entry: parseQueryOutput")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         vs = {}
@@ -497,8 +497,8 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
         if not graphOnly:
             ret["output"] = ou
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: parseQueryOutput")
 
         return ret
@@ -521,15 +521,15 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_show_query_performance[Show query performance]
         """
         logger.info("entry: getStatistics")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         seconds, segments = _prep_get_statistics(self, seconds, segments)
         ret = self._req("GET", self.restppUrl + "/statistics/" + self.graphname + "?seconds=" +
                         str(seconds) + "&segment=" + str(segments), resKey="")
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getStatistics")
 
         return ret
@@ -571,7 +571,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
                 {"queryName": queryName,
                  "description": queryDescription}
             ]}
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + params)
         if self._version_greater_than_4_0():
             res = self._put(self.gsUrl+"/gsql/v1/description?graph=" +
@@ -580,8 +580,8 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             res = self._put(self.gsUrl+"/gsqlserver/gsql/description?graph=" +
                             self.graphname, data=params, authMode="pwd", jsonData=True)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: describeQuery")
 
         return res
@@ -610,7 +610,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             raise TigerGraphException(
                 "This function is only supported on versions of TigerGraph >= 4.0.0.", 0)
 
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if isinstance(queryName, list):
@@ -623,7 +623,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             res = self._get(self.gsUrl+"/gsqlserver/gsql/description?graph=" +
                             self.graphname+"&query="+queryName, authMode="pwd", resKey=None)
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: getQueryDescription")
             return res["results"]["queries"]
         else:
@@ -654,7 +654,7 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             raise TigerGraphException(
                 "This function is only supported on versions of TigerGraph >= 4.0.0.", 0)
 
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
         if dropParamDescriptions:
             params = {"queries": [queryName],
@@ -669,8 +669,8 @@ class pyTigerGraphQuery(pyTigerGraphGSQL, pyTigerGraphSchema):
             res = self._delete(self.gsUrl+"/gsqlserver/gsql/description?graph=" +
                                self.graphname, authMode="pwd", data=params, jsonData=True, resKey=None)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: dropQueryDescription")
 
         return res
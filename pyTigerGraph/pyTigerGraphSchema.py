@@ -39,8 +39,8 @@ class pyTigerGraphSchema(pyTigerGraphBase):
             res = self._get(self.gsUrl + "/gsqlserver/gsql/udtlist?graph=" + self.graphname,
                             authMode="pwd")
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: _getUDTs")
 
         return res
@@ -65,7 +65,7 @@ class pyTigerGraphSchema(pyTigerGraphBase):
             - `GET /gsql/v1/schema/graphs/{graph_name}` (In TigerGraph version 4.x)
         """
         logger.info("entry: getSchema")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if not self.schema or force:
@@ -78,8 +78,8 @@ class pyTigerGraphSchema(pyTigerGraphBase):
         if udts and ("UDTs" not in self.schema or force):
             self.schema["UDTs"] = self._getUDTs()
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(self.schema))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", self.schema)
         logger.info("exit: getSchema")
 
         return self.schema
@@ -119,7 +119,7 @@ class pyTigerGraphSchema(pyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_upsert_data_to_graph[Upsert data to graph]
         """
         logger.info("entry: upsertData")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         data, headers, params = _prep_upsert_data(data=data, atomic=atomic, ackAll=ackAll, newVertexOnly=newVertexOnly,
@@ -128,8 +128,8 @@ class pyTigerGraphSchema(pyTigerGraphBase):
         res = self._post(self.restppUrl + "/graph/" + self.graphname, headers=headers, data=data,
                          params=params)[0]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: getSchema")
 
         return res
@@ -153,7 +153,7 @@ class pyTigerGraphSchema(pyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_list_all_endpoints[List all endpoints]
         """
         logger.info("entry: getEndpoints")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         bui, dyn, sta, url, ret = _prep_get_endpoints(
@@ -180,8 +180,8 @@ class pyTigerGraphSchema(pyTigerGraphBase):
         if sta:
             ret.update(self._req("GET", url + "static=true", resKey=""))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEndpoints")
 
         return ret
@@ -38,22 +38,22 @@ class pyTigerGraphUtils(pyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_echo[Echo]
         """
         logger.info("entry: echo")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if usePost:
             ret = str(self._post(self.restppUrl + "/echo/", resKey="message"))
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", ret)
             logger.info("exit: echo (POST)")
 
             return ret
 
         ret = str(self._get(self.restppUrl + "/echo/", resKey="message"))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: echo (GET)")
 
         return ret
@@ -71,8 +71,8 @@ class pyTigerGraphUtils(pyTigerGraphBase):
                         "/showlicenseinfo", resKey="", skipCheck=True)
         ret = _parse_get_license_info(res)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getLicenseInfo")
 
         return ret
@@ -83,11 +83,11 @@ class pyTigerGraphUtils(pyTigerGraphBase):
         Returns:
             Returns a JSON object with a key of "message" and a value of "pong"
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: ping")
         res = self._get(self.gsUrl+"/api/ping", resKey="")
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: ping")
             return res
         else:
@@ -127,7 +127,7 @@ class pyTigerGraphUtils(pyTigerGraphBase):
             - `POST /informant/metrics/get/{metrics_category}` (In TigerGraph versions 4.x)
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_monitor_system_metrics_by_category
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: getSystemMetrics")
 
         params, _json = _prep_get_system_metrics(
@@ -149,7 +149,7 @@ class pyTigerGraphUtils(pyTigerGraphBase):
         else:
             res = self._req("GET", self.gsUrl+"/ts3/api/datapoints",
                             authMode="pwd", params=params, resKey="")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("exit: getSystemMetrics")
         return res
 
@@ -161,14 +161,14 @@ class pyTigerGraphUtils(pyTigerGraphBase):
                 Seconds are measured up to 60, so the seconds parameter must be a positive integer less than or equal to 60.
                 Defaults to 10.
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: getQueryPerformance")
         params = {}
         if seconds:
             params["seconds"] = seconds
         res = self._get(self.restppUrl+"/statistics/" +
                         self.graphname, params=params, resKey="")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("exit: getQueryPerformance")
         return res
 
@@ -180,11 +180,11 @@ class pyTigerGraphUtils(pyTigerGraphBase):
             request_body (dict):
                 Must be formatted as specified here: https://docs.tigergraph.com/tigergraph-server/current/api/built-in-endpoints#_show_service_status
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: getServiceStatus")
         res = self._post(self.gsUrl+"/informant/current-service-status",
                          data=json.dumps(request_body), resKey="")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("exit: getServiceStatus")
         return res
 
@@ -207,7 +207,7 @@ class pyTigerGraphUtils(pyTigerGraphBase):
         Returns:
             JSON response with message containing the path to the summary file.
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: rebuildGraph")
         params = {}
         if threadnum:
@@ -223,7 +223,7 @@ class pyTigerGraphUtils(pyTigerGraphBase):
         res = self._get(self.restppUrl+"/rebuildnow/" +
                         self.graphname, params=params, resKey="")
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: rebuildGraph")
             return res
         else:
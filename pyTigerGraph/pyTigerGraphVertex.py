@@ -49,15 +49,15 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             The list of vertex types defined in the current graph.
         """
         logger.info("entry: getVertexTypes")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = []
         for vt in self.getSchema(force=force)["VertexTypes"]:
             ret.append(vt["Name"])
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertexTypes")
 
         return ret
@@ -78,7 +78,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             and it is a string.
         """
         logger.info("entry: getAttributes")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         et = self.getVertexType(vertexType)
@@ -88,8 +88,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             ret.append(
                 (at["AttributeName"], self._getAttrType(at["AttributeType"])))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getAttributes")
 
         return ret
@@ -108,13 +108,13 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             The metadata of the vertex type.
         """
         logger.info("entry: getVertexType")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         for vt in self.getSchema(force=force)["VertexTypes"]:
             if vt["Name"] == vertexType:
-                if logger.level == logging.DEBUG:
-                    logger.debug("return: " + str(vt))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("return: %s", vt)
                 logger.info("exit: getVertexType (found)")
 
                 return vt
@@ -162,7 +162,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_built_in_functions_on_graph[Run built-in functions]
         """
         logger.info("entry: getVertexCount")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         # If WHERE condition is not specified, use /builtins else use /vertices
@@ -176,8 +176,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                                       "type": vertexType},
                                 jsonData=True)[0]["count"]
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(res))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", res)
             logger.info("exit: getVertexCount (1)")
 
             return res
@@ -188,8 +188,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
 
         ret = _parse_get_vertex_count(res, vertexType, where)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertexCount (2)")
 
         return ret
@@ -227,7 +227,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_upsert_data_to_graph[Upsert data to graph]
         """
         logger.info("entry: upsertVertex")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         vals = _upsert_attrs(attributes)
@@ -236,8 +236,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         ret = self._req("POST", self.restppUrl + "/graph/" +
                         self.graphname, data=data)[0]["accepted_vertices"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertVertex")
 
         return ret
@@ -287,7 +287,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_upsert_data_to_graph[Upsert data to graph]
         """
         logger.info("entry: upsertVertices")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
         
         headers = {}
@@ -303,8 +303,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         ret = self._req("POST", self.restppUrl + "/graph/" +
                         self.graphname, data=data, headers=headers)[0]["accepted_vertices"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertVertices")
 
         return ret
@@ -336,15 +336,15 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             The number of vertices upserted.
         """
         logger.info("entry: upsertVertexDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         json_up = _prep_upsert_vertex_dataframe(
             df=df, v_id=v_id, attributes=attributes)
         ret = self.upsertVertices(vertexType=vertexType, vertices=json_up, atomic=atomic)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertVertexDataFrame")
 
         return ret
@@ -395,7 +395,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_list_vertices[List vertices]
         """
         logger.info("entry: getVertices")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url = _prep_get_vertices(
@@ -414,8 +414,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         elif fmt == "df":
             ret = _vS2DF(ret, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertices")
 
         return ret
@@ -454,14 +454,14 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             DataFrame.
         """
         logger.info("entry: getVertexDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = self.getVertices(vertexType, select=select, where=where, limit=limit, sort=sort,
                                fmt="df", withId=True, withType=False, timeout=timeout)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertexDataFrame")
 
         return ret
@@ -514,7 +514,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         TODO Find out how/if select and timeout can be specified
         """
         logger.info("entry: getVerticesById")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         vids, url = _prep_get_vertices_by_id(
@@ -533,8 +533,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         elif fmt == "df":
             ret = _vS2DF(ret, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVerticesById")
 
         return ret
@@ -557,14 +557,14 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             The (selected) details of the (matching) vertex instances as pandas DataFrame.
         """
         logger.info("entry: getVertexDataFrameById")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = self.getVerticesById(vertexType, vertexIds, select, fmt="df", withId=True,
                                    withType=False)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertexDataFrameById")
 
         return ret
@@ -600,7 +600,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_built_in_functions_on_graph[Run built-in functions]
         """
         logger.info("entry: getVertexStats")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         vts = []
@@ -620,8 +620,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
 
         ret = _parse_get_vertex_stats(responses, skipNA)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertexStats")
 
         return ret
@@ -665,7 +665,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_delete_vertices[Delete vertices]
         """
         logger.info("entry: delVertices")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url = _prep_del_vertices(
@@ -680,8 +680,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         )
         ret = self._req("DELETE", url)["deleted_vertices"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: delVertices")
 
         return ret
@@ -709,7 +709,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_delete_a_vertex[Delete a vertex]
         """
         logger.info("entry: delVerticesById")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url1, url2, vids = _prep_del_vertices_by_id(
@@ -725,8 +725,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             res = self._req("DELETE", url1 + str(vid) + url2)
             ret += res["deleted_vertices"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: delVerticesById")
 
         return ret
@@ -768,7 +768,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         )
         ret = self._delete(url)["deleted_vertices"]
 
-        logger.debug("return: " + str(ret))
+        logger.debug("return: %s", ret)
         logger.info("exit: delVerticesByType")
 
         return ret
@@ -790,13 +790,13 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             The vertex set as a pandas DataFrame.
         """
         logger.info("entry: vertexSetToDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = _vS2DF(vertexSet, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: vertexSetToDataFrame")
 
         return ret
\ No newline at end of file
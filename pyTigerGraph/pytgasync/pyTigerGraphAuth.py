@@ -13,8 +13,12 @@ from pyTigerGraph.common.exception import TigerGraphException
 from pyTigerGraph.common.auth import (
     _parse_get_secrets,
     _parse_create_secret,
+    _prep_drop_secret,
     _prep_token_request,
-    _parse_token_response
+    _parse_token_response,
+    _get_cached_token,
+    _cache_token,
+    _invalidate_cached_tokens
 )
 from pyTigerGraph.pytgasync.pyTigerGraphGSQL import AsyncPyTigerGraphGSQL
 
@@ -42,8 +46,8 @@ class AsyncPyTigerGraphAuth(AsyncPyTigerGraphGSQL):
             SHOW SECRET""".format(self.graphname), )
         ret = _parse_get_secrets(res)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getSecrets")
 
         return ret
@@ -84,7 +88,7 @@ class AsyncPyTigerGraphAuth(AsyncPyTigerGraphGSQL):
             should not be necessary and should not be executable by generic users.
         """
         logger.info("entry: createSecret")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         res = await self.gsql("""
@@ -93,17 +97,17 @@ class AsyncPyTigerGraphAuth(AsyncPyTigerGraphGSQL):
         secret = _parse_create_secret(
             res, alias=alias, withAlias=withAlias)
 
-        # Alias was not provided, let's find out the autogenerated one
+        # Alias was not provided and the response did not include it, let's find out the autogenerated one
         # done in createSecret since need to call self.getSecrets which is a possibly async function
-        if withAlias and not alias:
+        if withAlias and not isinstance(secret, dict):
             masked = secret[:3] + "****" + secret[-3:]
             secs = await self.getSecrets()
             for a, s in secs.items():
                 if s == masked:
                     secret = {a: secret}
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(secret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", secret)
         logger.info("exit: createSecret")
         return secret
 
@@ -122,23 +126,17 @@ class AsyncPyTigerGraphAuth(AsyncPyTigerGraphGSQL):
                 `ignoreErrors` is `True`). Re-raises other exceptions.
         """
         logger.info("entry: dropSecret")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
-        if isinstance(alias, str):
-            alias = [alias]
-        cmd = """
-            USE GRAPH {}""".format(self.graphname)
-        for a in alias:
-            cmd += """
-                DROP SECRET {}""".format(a)
+        cmd = _prep_drop_secret(self.graphname, alias)
         res = await self.gsql(cmd)
 
         if "Failed to drop secrets" in res and not ignoreErrors:
             raise TigerGraphException(res)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: dropSecret")
 
         return res
@@ -147,6 +145,7 @@ class AsyncPyTigerGraphAuth(AsyncPyTigerGraphGSQL):
         method, url, alt_url, authMode, data, alt_data = _prep_token_request(self.restppUrl,
                                                                              self.gsUrl,
                                                                              self.graphname,
+                                                                             pre_35=self._is_pre_35,
                                                                              secret=secret,
                                                                              lifetime=lifetime,
                                                                              token=token)
@@ -164,32 +163,50 @@ class AsyncPyTigerGraphAuth(AsyncPyTigerGraphGSQL):
             if _method:
                 method = _method
 
-            # Try using TG 4.1 endpoint first, if url not found then try <4.1 endpoint
-            try:
-                res = await self._req(method, url, authMode=authMode, data=data, resKey=None, jsonData=True)
-                mainVer = 4
-            except:
+            # (url, data, jsonData) of the token endpoint of each major version
+            endpoints = {3: (alt_url, alt_data, False), 4: (url, data, True)}
+            if self._token_endpoint_ver:
+                # The endpoint that worked before is used directly
+                mainVer = self._token_endpoint_ver
+                url, data, jsonData = endpoints[mainVer]
+                res = await self._req(method, url, authMode=authMode, data=data, resKey=None, jsonData=jsonData)
+            else:
+                # Try using TG 4.1 endpoint first, if url not found then try <4.1 endpoint
                 try:
-                    res = await self._req(method, alt_url, authMode=authMode, data=alt_data, resKey=None)
-                    mainVer = 3
+                    res = await self._req(method, url, authMode=authMode, data=data, resKey=None, jsonData=True)
+                    mainVer = 4
                 except:
-                    raise TigerGraphException("Error requesting token. Check if the connection's graphname is correct.", 400)
+                    try:
+                        res = await self._req(method, alt_url, authMode=authMode, data=alt_data, resKey=None)
+                        mainVer = 3
+                    except:
+                        raise TigerGraphException("Error requesting token. Check if the connection's graphname is correct.", 400)
+                self._token_endpoint_ver = mainVer
 
         # uses mainVer instead of _versionGreaterThan4_0 since you need a token for verson checking
         return res, mainVer
 
     async def getToken(self, secret: str = None, setToken: bool = True, lifetime: int = None) -> Union[tuple, str]:
         logger.info("entry: getToken")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
-        res, mainVer = await self._token(secret, lifetime)
-        token, auth_header = _parse_token_response(res,
-                                                   setToken,
-                                                   mainVer,
-                                                   self.base64_credential
-                                                  )
-        
+        key = (secret, self.graphname, lifetime)
+        token = _get_cached_token(self._token_cache, key)
+        if token is None:
+            res, mainVer = await self._token(secret, lifetime)
+            token, auth_header = _parse_token_response(res,
+                                                       setToken,
+                                                       mainVer,
+                                                       self.base64_credential
+                                                      )
+            _cache_token(self._token_cache, key, token, res, lifetime)
+        else:
+            if setToken:
+                auth_header = self._bearer_header(token[0] if isinstance(token, tuple) else token)
+            else:
+                auth_header = self._basic_header
+
         self.apiToken = token
         self.authHeader = auth_header
 
@@ -198,18 +215,23 @@ class AsyncPyTigerGraphAuth(AsyncPyTigerGraphGSQL):
 
     async def refreshToken(self, secret: str = None, setToken: bool = True, lifetime: int = None, token="") -> Union[tuple, str]:
         logger.info("entry: refreshToken")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
-
+        # The version check is cached, so unsupported versions fail before any other work
         if await self._version_greater_than_4_0():
             logger.info("exit: refreshToken")
             raise TigerGraphException(
                 "Refreshing tokens is only supported on versions of TigerGraph <= 4.0.0.", 0)
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
+
         if not token:
             token = self.apiToken
+        _invalidate_cached_tokens(self._token_cache, token)
         res, mainVer = await self._token(secret=secret, lifetime=lifetime, token=token, _method="PUT")
-        newToken = _parse_token_response(res, setToken, mainVer)
+        newToken, auth_header = _parse_token_response(res, setToken, mainVer, self.base64_credential)
+        if setToken:
+            self.apiToken = newToken
+            self.authHeader = auth_header
 
         logger.info("exit: refreshToken")
         return newToken
@@ -217,11 +239,12 @@ class AsyncPyTigerGraphAuth(AsyncPyTigerGraphGSQL):
     async def deleteToken(self, secret: str, token=None, skipNA=True) -> bool:
         if not token:
             token = self.apiToken
+        _invalidate_cached_tokens(self._token_cache, token)
         res, _ = await self._token(secret=secret, token=token, _method="DELETE")
 
         if not res["error"] or (res["code"] == "REST-3300" and skipNA):
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(True))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", True)
             logger.info("exit: deleteToken")
 
             return True
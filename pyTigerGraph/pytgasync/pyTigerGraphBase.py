@@ -26,14 +26,23 @@ print(resp)
 ```
 """
 
+import asyncio
 import json
 import logging
 import httpx
 
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Union
 from urllib.parse import urlparse
 
-from pyTigerGraph.common.base import PyTigerGraphCore
+from pyTigerGraph.common.base import SOCKET_OPTIONS, PyTigerGraphCore, _parse_version
+from pyTigerGraph.common.util import _json_loads
+
+try:
+    import h2  # noqa: F401 (HTTP/2 support of httpx, installed with httpx[http2])
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +107,58 @@ class AsyncPyTigerGraphBase(PyTigerGraphCore):
                          version=version, apiToken=apiToken, useCert=useCert, certPath=certPath,
                          debug=debug, sslPort=sslPort, gcp=gcp, jwtToken=jwtToken)
 
+        # The httpx client shared by all requests of this connection, see _client()
+        self._async_client = None
+        self._async_client_loop = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Returns the `httpx.AsyncClient` used to send the requests of this connection.
+
+        The client keeps connections to the server alive between requests and uses HTTP/2 (where
+        the server supports it) if the `h2` package is installed. It is bound to the event loop it
+        was created in, so a new one is created if the connection is used from another loop.
+        Call `close()`, or use the connection in an `async with` block, before the loop ends to
+        close the client's connections.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._async_client_loop is not loop:
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=30),
+                http2=HTTP2, socket_options=SOCKET_OPTIONS)
+            # Only connecting is timed out. Long queries and loading jobs are not cut off, and
+            # requests beyond the pool size wait for a connection instead of failing with `PoolTimeout`
+            # Cookies set by the server are not sent back, so requests stay independent of each
+            # other as with a client per request
+            self._async_client = httpx.AsyncClient(
+                transport=transport, timeout=httpx.Timeout(None, connect=5.0),
+                cookies=CookieJar(DefaultCookiePolicy(allowed_domains=[])))
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def close(self) -> None:
+        """Closes the HTTP connections held by this connection object.
+
+        Call it in the event loop the connection was used in before that loop ends, or use the
+        connection object as an async context manager, which calls it on exit:
+
+        ```python
+        async with AsyncTigerGraphConnection(host="http://localhost", graphname="MyGraph") as conn:
+            resp = await conn.echo()
+        ```
+
+        The connection object can still be used afterwards; new HTTP connections are opened as needed.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+
+    async def __aenter__(self) -> "AsyncPyTigerGraphBase":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def _req(self, method: str, url: str, authMode: str = "token", headers: dict = None,
                    data: Union[dict, list, str] = None, resKey: str = "results", skipCheck: bool = False,
                    params: Union[dict, list, str] = None, strictJson: bool = True, jsonData: bool = False,
@@ -133,16 +194,16 @@ class AsyncPyTigerGraphBase(PyTigerGraphCore):
         _headers, _data, verify = self._prep_req(
             authMode, headers, url, method, data)
 
-        async with httpx.AsyncClient() as client:
-            if jsonData:
-                res = await client.request(method, url, headers=_headers, json=_data, params=params)
-            else:
-                res = await client.request(method, url, headers=_headers, data=_data, params=params)
+        client = self._client()
+        if jsonData:
+            res = await client.request(method, url, headers=_headers, json=_data, params=params)
+        else:
+            res = await client.request(method, url, headers=_headers, data=_data, params=params)
 
         try:
             if not skipCheck and not (200 <= res.status_code < 300) and res.status_code != 404:
                 try:
-                    self._error_check(json.loads(res.text))
+                    self._error_check(_json_loads(res))
                 except json.decoder.JSONDecodeError:
                     # could not parse the res text (probably returned an html response)
                     pass
@@ -161,14 +222,13 @@ class AsyncPyTigerGraphBase(PyTigerGraphCore):
                 else:
                     url = newRestppUrl + '/' + \
                         '/'.join(url.split(':')[2].split('/')[1:])
-                async with httpx.AsyncClient() as client:
-                    if jsonData:
-                        res = await client.request(method, url, headers=_headers, json=_data, params=params)
-                    else:
-                        res = await client.request(method, url, headers=_headers, data=_data, params=params)
+                if jsonData:
+                    res = await client.request(method, url, headers=_headers, json=_data, params=params)
+                else:
+                    res = await client.request(method, url, headers=_headers, data=_data, params=params)
                 if not skipCheck and not (200 <= res.status_code < 300) and res.status_code != 404:
                     try:
-                        self._error_check(json.loads(res.text))
+                        self._error_check(_json_loads(res))
                     except json.decoder.JSONDecodeError:
                         # could not parse the res text (probably returned an html response)
                         pass
@@ -203,13 +263,13 @@ class AsyncPyTigerGraphBase(PyTigerGraphCore):
             The (relevant part of the) response from the request (as a dictionary).
        """
         logger.info("entry: _get")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         res = await self._req("GET", url, authMode, headers, None, resKey, skipCheck, params, strictJson)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: _get")
 
         return res
@@ -240,13 +300,13 @@ class AsyncPyTigerGraphBase(PyTigerGraphCore):
             The (relevant part of the) response from the request (as a dictionary).
         """
         logger.info("entry: _post")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         res = await self._req("POST", url, authMode, headers, data, resKey, skipCheck, params, jsonData=jsonData)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: _post")
 
         return res
@@ -264,13 +324,13 @@ class AsyncPyTigerGraphBase(PyTigerGraphCore):
             The response from the request (as a dictionary).
         """
         logger.info("entry: _put")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         res = await self._req("PUT", url, authMode, data=data, resKey=resKey, jsonData=jsonData)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: _put")
 
         return res
@@ -288,13 +348,13 @@ class AsyncPyTigerGraphBase(PyTigerGraphCore):
             The response from the request (as a dictionary).
         """
         logger.info("entry: _delete")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         res = await self._req("DELETE", url, authMode, data=data, resKey=resKey, jsonData=jsonData)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: _delete")
 
         return res
@@ -316,13 +376,13 @@ class AsyncPyTigerGraphBase(PyTigerGraphCore):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_show_component_versions[Show component versions]
         """
         logger.info("entry: getVersion")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
         response = await self._get(self.restppUrl+"/version", strictJson=False, resKey="message")
         components = self._parse_get_version(response, raw)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(components))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", components)
         logger.info("exit: getVersion")
         return components
 
@@ -344,13 +404,13 @@ class AsyncPyTigerGraphBase(PyTigerGraphCore):
             `TigerGraphException` if invalid/non-existent component is specified.
         """
         logger.info("entry: getVer")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
         version = await self.getVersion()
         ret = self._parse_get_ver(version, component, full)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVer")
 
         return ret
@@ -372,11 +432,11 @@ class AsyncPyTigerGraphBase(PyTigerGraphCore):
     async def _version_greater_than_4_0(self) -> bool:
         """Gets if the TigerGraph database version is greater than 4.0 using gerVer().
 
+        The version is only requested from the database the first time.
+
         Returns:
             Boolean of whether databse version is greater than 4.0.
         """
-        version = await self.getVer()
-        version = version.split('.')
-        if version[0] >= "4" and version[1] > "0":
-            return True
-        return False
+        if self._version_gt_4_0 is None:
+            self._version_gt_4_0 = _parse_version(await self.getVer())[:2] > (4, 0)
+        return self._version_gt_4_0
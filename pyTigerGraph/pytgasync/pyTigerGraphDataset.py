@@ -4,9 +4,20 @@ Ingest stock datasets into a TigerGraph database.
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object]. 
 """
 
+import asyncio
 import logging
-
-from pyTigerGraph.common.dataset import _parse_ingest_dataset
+import time
+
+import httpx
+
+from pyTigerGraph.common.exception import TigerGraphException
+from pyTigerGraph.common.dataset import (
+    GRAPH_EXISTS_TTL,
+    _clean_up_ingest_dataset,
+    _parse_check_exist_graphs,
+    _parse_ingest_dataset_response,
+    _prep_check_exist_graphs
+)
 from pyTigerGraph.pytgasync.datasets import AsyncDatasets
 from pyTigerGraph.pytgasync.pyTigerGraphAuth import AsyncPyTigerGraphAuth
 
@@ -34,7 +45,7 @@ class AsyncPyTigerGraphDataset(AsyncPyTigerGraphAuth):
                 when auth token is enabled for the database. Defaults to False.
         """
         logger.info("entry: ingestDataset")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if not dataset.ingest_ready:
@@ -47,7 +58,7 @@ class AsyncPyTigerGraphDataset(AsyncPyTigerGraphAuth):
             # ))
             self.graphname = dataset.name
             if getToken:
-                await self.getToken(await self.createSecret())
+                await self._acquireToken()
             print(
                 "A graph with name {} already exists in the database. "
                 "Skip ingestion.".format(dataset.name)
@@ -61,34 +72,84 @@ class AsyncPyTigerGraphDataset(AsyncPyTigerGraphAuth):
         if "Failed" in resp:
             return
 
-        print("---- Creating schema ----", flush=True)
-        resp = await dataset.create_schema(self)
-        print(resp, flush=True)
-        if "Failed" in resp:
-            return
-
-        print("---- Creating loading job ----", flush=True)
-        resp = await dataset.create_load_job(self)
-        print(resp, flush=True)
-        if "Failed" in resp:
-            return
-
-        print("---- Ingesting data ----", flush=True)
+        # The token only needs the graph to exist, so request it while the schema and the
+        # loading job are being created. Only the REST request overlaps with the schema
+        # change, a secret is created with GSQL afterwards if it is needed. Versions before
+        # 3.5 always need a secret, so there is nothing to request early.
         self.graphname = dataset.name
-        if getToken:
-            secret = await self.createSecret()
-            await self.getToken(secret)
+        token_task = None
+        token_error = None
+        if getToken and not self._is_pre_35:
+            token_task = asyncio.create_task(self.getToken())
+
+        try:
+            print("---- Creating schema ----", flush=True)
+            resp = await dataset.create_schema(self)
+            print(resp, flush=True)
+            if "Failed" in resp:
+                return
+
+            print("---- Creating loading job ----", flush=True)
+            resp = await dataset.create_load_job(self)
+            print(resp, flush=True)
+            if "Failed" in resp:
+                return
+        finally:
+            if token_task is not None:
+                # Collected on every exit path, so a failed request is never left unretrieved
+                try:
+                    await token_task
+                except Exception as err:
+                    token_error = err
+
+        if getToken and (token_task is None
+                         or isinstance(token_error, (TigerGraphException, httpx.HTTPError))):
+            await self.getToken(await self.createSecret())
+        elif token_error is not None:
+            raise token_error
 
-        responses = []
-        for resp in await dataset.run_load_job(self):
-            responses.append(resp)
+        print("---- Ingesting data ----", flush=True)
 
-        _parse_ingest_dataset(responses, cleanup, dataset)
+        async for resp in dataset.run_load_job(self):
+            _parse_ingest_dataset_response(resp)
+        _clean_up_ingest_dataset(cleanup, dataset)
 
         print("---- Finished ingestion ----", flush=True)
         logger.info("exit: ingestDataset")
 
+    async def _acquireToken(self) -> None:
+        "NO DOC"
+        # Versions before 3.5 only issue tokens for a secret
+        if self._is_pre_35:
+            await self.getToken(await self.createSecret())
+            return
+        # Otherwise the version can't be checked before there is a token, so try the user's
+        # credentials first (>4.0) and create a secret only if the server doesn't accept them
+        try:
+            await self.getToken()
+        except (TigerGraphException, httpx.HTTPError):
+            await self.getToken(await self.createSecret())
+
     async def check_exist_graphs(self, name: str) -> bool:
         "NO DOC"
-        resp = await self.gsql("ls")
-        return "Graph {}".format(name) in resp
+        if self._graph_exists_cache.get(name, 0) > time.time():
+            return True
+
+        exists = None
+        # Checking the version needs a token, without one the probe would only fail
+        if self._version_gt_4_0 is not None or self.apiToken or self.jwtToken:
+            try:
+                res = await self._get(
+                    _prep_check_exist_graphs(self.gsUrl, name, await self._version_greater_than_4_0()),
+                    authMode="pwd", resKey=None, skipCheck=True)
+                exists = _parse_check_exist_graphs(res)
+            except (TigerGraphException, httpx.HTTPError, ValueError):
+                # ValueError covers responses that are not JSON
+                pass
+        if exists is None:
+            resp = await self.gsql("ls")
+            exists = "Graph {}".format(name) in resp
+
+        if exists:
+            self._graph_exists_cache[name] = time.time() + GRAPH_EXISTS_TTL
+        return exists
@@ -55,7 +55,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             The list of edge types defined in the current graph.
         """
         logger.info("entry: getEdgeTypes")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = []
@@ -63,8 +63,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
         for et in schema["EdgeTypes"]:
             ret.append(et["Name"])
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeTypes")
 
         return ret
@@ -83,14 +83,14 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             The metadata of the edge type.
         """
         logger.info("entry: getEdgeType")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         schema = await self.getSchema(force=force)
         for et in schema["EdgeTypes"]:
             if et["Name"] == edgeType:
-                if logger.level == logging.DEBUG:
-                    logger.debug("return: " + str(et))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("return: %s", et)
                 logger.info("exit: getEdgeType (found)")
 
                 return et
@@ -116,7 +116,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             and it is a string.
         """
         logger.info("entry: getAttributes")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         et = await self.getEdgeType(edgeType)
@@ -126,8 +126,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             ret.append(
                 (at["AttributeName"], _get_attr_type(at["AttributeType"])))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getAttributes")
 
         return ret
@@ -156,7 +156,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
                 valid/defined.
         """
         logger.info("entry: getEdgeSourceVertexType")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         edgeTypeDetails = await self.getEdgeType(edgeType)
@@ -186,7 +186,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
                 the individual source/target pairs to find out which combinations are valid/defined.
         """
         logger.info("entry: getEdgeTargetVertexType")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         edgeTypeDetails = await self.getEdgeType(edgeType)
@@ -204,14 +204,14 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             `True`, if the edge is directed.
         """
         logger.info("entry: isDirected")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = await self.getEdgeType(edgeType)
         ret = ret["IsDirected"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: isDirected")
 
         return ret
@@ -227,7 +227,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             The name of the reverse edge, if it was defined.
         """
         logger.info("entry: getReverseEdge")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if not await self.isDirected(edgeType):
@@ -241,8 +241,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
         if "REVERSE_EDGE" in config:
             ret = config["REVERSE_EDGE"]
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", ret)
             logger.info("exit: getReverseEdge (reverse edge found)")
 
             return ret
@@ -263,14 +263,14 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             `True`, if the edge can have multiple instances between the same pair of vertices.
         """
         logger.info("entry: isMultiEdge")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         et = await self.getEdgeType(edgeType)
         ret = ("DiscriminatorCount" in et) and et["DiscriminatorCount"] > 0
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: isMultiEdge")
 
         return ret
@@ -286,7 +286,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             A list of (attribute_name, attribute_type) tuples.
         """
         logger.info("entry: getDiscriminators")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         et = await self.getEdgeType(edgeType)
@@ -297,8 +297,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
                 ret.append(
                     (at["AttributeName"], _get_attr_type(at["AttributeType"])))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getDiscriminators")
 
         return ret
@@ -348,7 +348,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
                 See https://docs.tigergraph.com/tigergraph-server/current/api/built-in-endpoints#_run_built_in_functions_on_graph
         """
         logger.info("entry: getEdgeCountFrom")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url, data = _prep_get_edge_count_from(restppUrl=self.restppUrl,
@@ -365,8 +365,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             res = await self._req("GET", url)
         ret = _parse_get_edge_count_from(res, edgeType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeCountFrom  (multiple edge types)")
 
         return ret
@@ -391,14 +391,14 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             A dictionary of `edge_type: edge_count` pairs.
         """
         logger.info("entry: getEdgeCount")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = await self.getEdgeCountFrom(edgeType=edgeType, sourceVertexType=sourceVertexType,
                                           targetVertexType=targetVertexType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeCount")
 
         return ret
@@ -448,7 +448,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             parameters and functionality.
         """
         logger.info("entry: upsertEdge")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         data = _prep_upsert_edge(sourceVertexType,
@@ -460,8 +460,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
         ret = await self._req("POST", self.restppUrl + "/graph/" + self.graphname, data=data)
         ret = ret[0]["accepted_edges"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertEdge")
 
         return ret
@@ -512,7 +512,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
         """
 
         logger.info("entry: upsertEdges")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         """
@@ -537,8 +537,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
         ret = await self._req("POST", self.restppUrl + "/graph/" + self.graphname, data=data)
         ret = ret[0]["accepted_edges"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertEdges")
 
         return ret
@@ -578,14 +578,14 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             The number of edges upserted.
         """
         logger.info("entry: upsertEdgeDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         json_up = _prep_upsert_edge_dataframe(df, from_id, to_id, attributes)
         ret = await self.upsertEdges(sourceVertexType, edgeType, targetVertexType, json_up, atomic=atomic)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertEdgeDataFrame")
 
         return ret
@@ -642,7 +642,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#list-edges-of-a-vertex
         """
         logger.info("entry: getEdges")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url = _prep_get_edges(self.restppUrl,
@@ -664,8 +664,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
         elif fmt == "df":
             ret = _eS2DF(ret, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdges")
 
         return ret
@@ -708,14 +708,14 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             JSON or pandas DataFrame.
         """
         logger.info("entry: getEdgesDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = await self.getEdges(sourceVertexType, sourceVertexId, edgeType, targetVertexType,
                                   targetVertexId, select, where, limit, sort, fmt="df", timeout=timeout)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgesDataFrame")
 
         return ret
@@ -760,7 +760,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             DataFrame.
         """
         logger.info("entry: getEdgesByType")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if not edgeType:
@@ -783,8 +783,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
         elif fmt == "df":
             ret = _eS2DF(ret, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: _upsertAttrs")
 
         return ret
@@ -809,7 +809,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#run-built-in-functions-on-graph
         """
         logger.info("entry: getEdgeStats")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ets = []
@@ -834,8 +834,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             responses.append((et, res))
         ret = _parse_get_edge_stats(responses, skipNA)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEdgeStats")
 
         return ret
@@ -878,7 +878,7 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#delete-an-edge
         """
         logger.info("entry: delEdges")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url = _prep_del_edges(self.restppUrl,
@@ -897,8 +897,8 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
         for r in res:
             ret[r["e_type"]] = r["deleted_edges"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: delEdges")
 
         return ret
@@ -918,13 +918,13 @@ class AsyncPyTigerGraphEdge(AsyncPyTigerGraphQuery):
             The edge set as a pandas DataFrame.
         """
         logger.info("entry: edgeSetToDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = _eS2DF(edgeSet, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: edgeSetToDataFrame")
 
         return ret
\ No newline at end of file
@@ -91,7 +91,7 @@ class AsyncPyTigerGraphGSQL(AsyncPyTigerGraphBase):
             - `GET /gsql/v1/udt/files/{ExprFunctions or ExprUtil}` (In TigerGraph versions 4.x)
         """
         logger.info("entry: getUDF")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         urls, alt_urls = _prep_get_udf(
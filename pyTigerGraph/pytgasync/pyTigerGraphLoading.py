@@ -63,7 +63,7 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_a_loading_job[Run a loading job]
         """
         logger.info("entry: runLoadingJobWithDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if columns is None:
@@ -110,7 +110,7 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_a_loading_job[Run a loading job]
         """
         logger.info("entry: runLoadingJobWithFile")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         data = _prep_run_loading_job_with_file(filePath)
@@ -153,7 +153,7 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_a_loading_job[Run a loading job]
         """
         logger.info("entry: runLoadingJobWithData")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if not data or not jobName or not fileTag:
@@ -179,8 +179,8 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
             res = await self._req("POST", self.restppUrl + "/ddl/" + self.graphname, params=params, data=data,
                             headers={"RESPONSE-LIMIT": str(sizeLimit), "GSQL-TIMEOUT": str(timeout)})
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: runLoadingJobWithData")
 
         return res
@@ -207,13 +207,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
         """
         logger.info("entry: getLoadingJobs")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_loading_job_url(self.gsUrl, self.graphname)
 
         res = await self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: getLoadingJobs")
 
         return res
@@ -231,13 +232,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
         """
         logger.info("entry: createLoadingJob")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_loading_job_url(self.gsUrl, self.graphname)
 
         res = self._req("POST", url, data=job_definition)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: createLoadingJob")
 
         return res
@@ -255,13 +257,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
         """
         logger.info("entry: updateLoadingJob")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_loading_job_url(self.gsUrl, self.graphname)
 
         res = await self._req("PUT", url, data=job_definition)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: updateLoadingJob")
 
         return res
@@ -281,13 +284,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
         """
         logger.info("entry: getLoadingJobInfo")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_loading_job_info(self.gsUrl, jobName, self.graphname, verbose)
 
         res = await self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: getLoadingJobInfo")
 
         return res
@@ -320,13 +324,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
                 See xref:tigergraph-server:API:gsql-endpoints.adoc#_run_loading_job[Run a loading job]
         """
         logger.info("entry: runLoadingJob")
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url, data = _prep_run_loading_job(self.gsUrl, self.graphname, jobName, data_source_config, sys_data_root, verbose, dryrun, interval, maxNumError, maxPercentError)
 
         res = await self._req("POST", url, data=data)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: runLoadingJob")
 
         return res
@@ -344,13 +349,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
         """
         logger.info("entry: dropLoadingJob")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_loading_job_info(self.gsUrl, jobName, self.graphname)
 
         res = await self._req("DELETE", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: dropLoadingJob")
 
         return res
@@ -370,13 +376,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
         """
         logger.info("entry: abortLoadingJobs")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_abort_loading_jobs(self.gsUrl, self.graphname, jobIds, pauseJob)
 
         res = await self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: abortLoadingJobs")
 
         return res
@@ -396,13 +403,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
         """
         logger.info("entry: abortLoadingJob")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_abort_one_loading_job(self.gsUrl, self.graphname, jobId, pauseJob)
 
         res = await self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: abortLoadingJob")
 
         return res
@@ -420,13 +428,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
         """
         logger.info("entry: resumeLoadingJob")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_resume_loading_job(self.gsUrl, jobId)
 
         res = await self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: resumeLoadingJob")
 
         return res
@@ -444,13 +453,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
         """
         logger.info("entry: getLoadingJobsStatus")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_get_loading_jobs_status(self.gsUrl, self.graphname, jobIds)
 
         res = await self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: getLoadingJobsStatus")
 
         return res
@@ -468,13 +478,14 @@ class AsyncPyTigerGraphLoading(AsyncPyTigerGraphBase):
         """
         logger.info("entry: getLoadingJobStatus")
 
-        logger.debug("params: " + self._locals(locals()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("params: " + self._locals(locals()))
 
         url = _prep_get_loading_job_status(self.gsUrl, self.graphname, jobId)
 
         res = await self._req("GET", url)
 
-        logger.debug("return: " + str(res))
+        logger.debug("return: %s", res)
         logger.info("exit: getLoadingJobStatus")
 
         return res
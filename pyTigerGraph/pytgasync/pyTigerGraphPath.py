@@ -63,15 +63,15 @@ class AsyncPyTigerGraphPath(AsyncPyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_find_shortest_path[Find the shortest path].
         """
         logger.info("entry: shortestPath")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         data = _prepare_path_params(sourceVertices, targetVertices, maxLength, vertexFilters,
                                          edgeFilters, allShortestPaths)
         ret = await self._post(self.restppUrl + "/shortestpath/" + self.graphname, data=data)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: shortestPath")
 
         return ret
@@ -118,15 +118,15 @@ class AsyncPyTigerGraphPath(AsyncPyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_find_all_paths[Find all paths]
         """
         logger.info("entry: allPaths")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         data = _prepare_path_params(sourceVertices, targetVertices, maxLength, vertexFilters,
                                          edgeFilters)
         ret = await self._post(self.restppUrl + "/allpaths/" + self.graphname, data=data)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: allPaths")
 
         return ret
@@ -31,10 +31,10 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
             queryName (str):
                 Name of the query to get metadata of.
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: showQuery")
         res = await self.gsql("USE GRAPH "+self.graphname+" SHOW QUERY "+queryName)
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("exit: showQuery")
         return res
 
@@ -52,7 +52,7 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc_get_query_metadata
             - `POST /gsql/v1/queries/signature` (In TigerGraph versions 4.x)
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: getQueryMetadata")
         if await self._version_greater_than_4_0():
             params = {"graph": self.graphname, "queryName": queryName}
@@ -61,7 +61,7 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
             params = {"graph": self.graphname, "query": queryName}
             res = await self._req("GET", self.gsUrl+"/gsqlserver/gsql/queryinfo", params=params, authMode="pwd", resKey="")
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: getQueryMetadata")
             return res
         else:
@@ -85,14 +85,14 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
         TODO Return with query name as key rather than REST endpoint as key?
         """
         logger.info("entry: getInstalledQueries")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = await self.getEndpoints(dynamic=True)
         ret = _parse_get_installed_queries(fmt, ret)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getInstalledQueries")
 
         return ret
@@ -171,7 +171,7 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_an_installed_query_post[Run an installed query (POST)]
         """
         logger.info("entry: runInstalledQuery")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         headers, res_key = _prep_run_installed_query(timeout=timeout, sizeLimit=sizeLimit, runAsync=runAsync,
@@ -181,8 +181,8 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
             ret = await self._req("POST", self.restppUrl + "/query/" + self.graphname + "/" + queryName,
                                   data=params, headers=headers, resKey=res_key, jsonData=True)
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", ret)
             logger.info("exit: runInstalledQuery (POST)")
 
             return ret
@@ -192,8 +192,8 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
             ret = await self._req("GET", self.restppUrl + "/query/" + self.graphname + "/" + queryName,
                                   params=params, headers=headers, resKey=res_key)
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", ret)
             logger.info("exit: runInstalledQuery (GET)")
 
             return ret
@@ -276,7 +276,7 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
             plus parameters if applicable to interpreted queries (see runInstalledQuery() above)
         """
         logger.info("entry: runInterpretedQuery")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         queryText = queryText.replace("$graphname", self.graphname)
@@ -292,8 +292,8 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
             ret = await self._req("POST", self.gsUrl + "/gsqlserver/interpreted_query", data=queryText,
                                   params=params, authMode="pwd")
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: runInterpretedQuery")
 
         return ret
@@ -301,11 +301,11 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
     async def getRunningQueries(self) -> dict:
         """Reports the statistics of currently running queries on the graph.
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: getRunningQueries")
         res = await self._req("GET", self.restppUrl+"/showprocesslist/"+self.graphname, resKey="")
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: getRunningQueries")
             return res
         else:
@@ -320,7 +320,7 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
                 The ID(s) of the query(s) to abort. If set to "all", it will abort all running queries.
             url
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: abortQuery")
         params = {}
         if request_id:
@@ -329,7 +329,7 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
             params["url"] = url
         res = await self._get(self.restppUrl+"/abortquery/"+self.graphname, params=params, resKey="")
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: abortQuery")
             return res
         else:
@@ -353,15 +353,15 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_show_query_performance[Show query performance]
         """
         logger.info("entry: getStatistics")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         seconds, segments = _prep_get_statistics(self, seconds, segments)
         ret = await self._req("GET", self.restppUrl + "/statistics/" + self.graphname + "?seconds=" +
                               str(seconds) + "&segment=" + str(segments), resKey="")
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getStatistics")
 
         return ret
@@ -403,15 +403,15 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
                 {"queryName": queryName,
                  "description": queryDescription}
             ]}
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + params)
         if await self._version_greater_than_4_0():
             res = await self._put(self.gsUrl+"/gsql/v1/description?graph="+self.graphname, data=params, authMode="pwd", jsonData=True)
         else:
             res = await self._put(self.gsUrl+"/gsqlserver/gsql/description?graph="+self.graphname, data=params, authMode="pwd", jsonData=True)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: describeQuery")
 
         return res
@@ -440,7 +440,7 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
             raise TigerGraphException(
                 "This function is only supported on versions of TigerGraph >= 4.0.0.", 0)
 
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if isinstance(queryName, list):
@@ -451,7 +451,7 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
         else:
             res = await self._get(self.gsUrl+"/gsqlserver/gsql/description?graph="+self.graphname+"&query="+queryName, authMode="pwd", resKey=None)
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: getQueryDescription")
             return res["results"]["queries"]
         else:
@@ -482,7 +482,7 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
             raise TigerGraphException(
                 "This function is only supported on versions of TigerGraph >= 4.0.0.", 0)
 
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
         if dropParamDescriptions:
             params = {"queries": [queryName],
@@ -495,8 +495,8 @@ class AsyncPyTigerGraphQuery(AsyncPyTigerGraphGSQL):
         else:
             res = await self._delete(self.gsUrl+"/gsqlserver/gsql/description?graph="+self.graphname, authMode="pwd", data=params, jsonData=True, resKey=None)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: dropQueryDescription")
 
         return res
@@ -39,8 +39,8 @@ class AsyncPyTigerGraphSchema(AsyncPyTigerGraphBase):
             res = await self._req("GET", self.gsUrl + "/gsqlserver/gsql/udtlist?graph=" + self.graphname,
                                   authMode="pwd")
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: _getUDTs")
 
         return res
@@ -65,7 +65,7 @@ class AsyncPyTigerGraphSchema(AsyncPyTigerGraphBase):
             - `GET /gsql/v1/schema/graphs/{graph_name}`
         """
         logger.info("entry: getSchema")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if not self.schema or force:
@@ -78,8 +78,8 @@ class AsyncPyTigerGraphSchema(AsyncPyTigerGraphBase):
         if udts and ("UDTs" not in self.schema or force):
             self.schema["UDTs"] = await self._getUDTs()
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(self.schema))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", self.schema)
         logger.info("exit: getSchema")
 
         return self.schema
@@ -119,7 +119,7 @@ class AsyncPyTigerGraphSchema(AsyncPyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_upsert_data_to_graph[Upsert data to graph]
         """
         logger.info("entry: upsertData")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         data, headers, params = _prep_upsert_data(data=data, atomic=atomic, ackAll=ackAll, newVertexOnly=newVertexOnly,
@@ -129,8 +129,8 @@ class AsyncPyTigerGraphSchema(AsyncPyTigerGraphBase):
                               params=params)
         res = res[0]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(res))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", res)
         logger.info("exit: getSchema")
 
         return res
@@ -154,7 +154,7 @@ class AsyncPyTigerGraphSchema(AsyncPyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_list_all_endpoints[List all endpoints]
         """
         logger.info("entry: getEndpoints")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         bui, dyn, sta, url, ret = _prep_get_endpoints(
@@ -181,8 +181,8 @@ class AsyncPyTigerGraphSchema(AsyncPyTigerGraphBase):
         if sta:
             ret.update(await self._req("GET", url + "static=true", resKey=""))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getEndpoints")
 
         return ret
@@ -4,8 +4,11 @@ The functions on this page retrieve information about user-defined tuples (UDT)
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object].
 """
 
+import copy
 import logging
+import time
 
+from pyTigerGraph.common.schema import UDT_CACHE_TTL
 from pyTigerGraph.pytgasync.pyTigerGraphSchema import AsyncPyTigerGraphSchema
 # from pyTigerGraph.pyTigerGraphUDT import pyTigerGraphUDT
 
@@ -14,6 +17,21 @@ logger = logging.getLogger(__name__)
 
 class AsyncPyTigerGraphUDT(AsyncPyTigerGraphSchema):
 
+    async def _getUDTsCached(self) -> dict:
+        """Returns the UDTs of the graph as a `{name: fields}` dictionary.
+
+        The result of `_getUDTs()` is reused for `UDT_CACHE_TTL` seconds, so looking up several
+        UDTs in a row only fetches the list once.
+        """
+        cached = self._udt_cache
+        if cached is None or cached[0] != self.graphname or cached[1] <= time.time():
+            udts = await self._getUDTs()
+            cached = (self.graphname, time.time() + UDT_CACHE_TTL,
+                      {udt["name"]: udt["fields"] for udt in udts})
+            self._udt_cache = cached
+
+        return cached[2]
+
     async def getUDTs(self) -> list:
         """Returns the list of User-Defined Tuples (names only).
 
@@ -24,12 +42,10 @@ class AsyncPyTigerGraphUDT(AsyncPyTigerGraphSchema):
         """
         logger.info("entry: getUDTs")
 
-        ret = []
-        for udt in await self._getUDTs():
-            ret.append(udt["name"])
+        ret = list(await self._getUDTsCached())
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getUDTs")
 
         return ret
@@ -48,20 +64,20 @@ class AsyncPyTigerGraphUDT(AsyncPyTigerGraphSchema):
 
         """
         logger.info("entry: getUDT")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
-        for udt in await self._getUDTs():
-            if udt["name"] == udtName:
-                ret = udt["fields"]
-
-                if logger.level == logging.DEBUG:
-                    logger.debug("return: " + str(ret))
-                logger.info("exit: getUDT (found)")
+        ret = (await self._getUDTsCached()).get(udtName)
+        if ret is not None:
+            # A copy, so that changes made by the caller don't reach the cache
+            ret = copy.deepcopy(ret)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", ret)
+            logger.info("exit: getUDT (found)")
 
-                return ret
+            return ret
 
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.warning("UDT `" + udtName + "` was not found")
         logger.info("exit: getUDT (not found)")
 
@@ -37,22 +37,22 @@ class AsyncPyTigerGraphUtils(AsyncPyTigerGraphBase):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_echo[Echo]
         """
         logger.info("entry: echo")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         if usePost:
             ret = str(await self._req("POST", self.restppUrl + "/echo/", resKey="message"))
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", ret)
             logger.info("exit: echo (POST)")
 
             return ret
 
         ret = str(await self._req("GET", self.restppUrl + "/echo/", resKey="message"))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: echo (GET)")
 
         return ret
@@ -69,8 +69,8 @@ class AsyncPyTigerGraphUtils(AsyncPyTigerGraphBase):
         res = await self._req("GET", self.restppUrl + "/showlicenseinfo", resKey="", skipCheck=True)
         ret = _parse_get_license_info(res)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getLicenseInfo")
 
         return ret
@@ -81,11 +81,11 @@ class AsyncPyTigerGraphUtils(AsyncPyTigerGraphBase):
         Returns:
             Returns a JSON object with a key of "message" and a value of "pong"
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: ping")
         res = await self._req("GET", self.gsUrl+"/api/ping", resKey="")
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: ping")
             return res
         else:
@@ -126,7 +126,7 @@ class AsyncPyTigerGraphUtils(AsyncPyTigerGraphBase):
             - `POST /informant/metrics/get/{metrics_category}` (In TigerGraph versions 4.x)
                 ee xref:tigergraph-server:API:built-in-endpoints.adoc#_monitor_system_metrics_by_category
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: getSystemMetrics")
 
         params, _json = _prep_get_system_metrics(
@@ -146,7 +146,7 @@ class AsyncPyTigerGraphUtils(AsyncPyTigerGraphBase):
             res = await self._req("POST", self.gsUrl+"/informant/metrics/get/"+what, data=_json, jsonData=True, resKey="")
         else:
             res = await self._req("GET", self.gsUrl+"/ts3/api/datapoints", authMode="pwd", params=params, resKey="")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("exit: getSystemMetrics")
         return res
 
@@ -158,13 +158,13 @@ class AsyncPyTigerGraphUtils(AsyncPyTigerGraphBase):
                 Seconds are measured up to 60, so the seconds parameter must be a positive integer less than or equal to 60.
                 Defaults to 10.
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: getQueryPerformance")
         params = {}
         if seconds:
             params["seconds"] = seconds
         res = await self._get(self.restppUrl+"/statistics/"+self.graphname, params=params, resKey="")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("exit: getQueryPerformance")
         return res
 
@@ -176,10 +176,10 @@ class AsyncPyTigerGraphUtils(AsyncPyTigerGraphBase):
             request_body (dict):
                 Must be formatted as specified here: https://docs.tigergraph.com/tigergraph-server/current/api/built-in-endpoints#_show_service_status
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: getServiceStatus")
         res = await self._req("POST", self.gsUrl+"/informant/current-service-status", data=json.dumps(request_body), resKey="")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("exit: getServiceStatus")
         return res
 
@@ -202,7 +202,7 @@ class AsyncPyTigerGraphUtils(AsyncPyTigerGraphBase):
         Returns:
             JSON response with message containing the path to the summary file.
         """
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("entry: rebuildGraph")
         params = {}
         if threadnum:
@@ -217,7 +217,7 @@ class AsyncPyTigerGraphUtils(AsyncPyTigerGraphBase):
             params["force"] = force
         res = await self._req("GET", self.restppUrl+"/rebuildnow/"+self.graphname, params=params, resKey="")
         if not res["error"]:
-            if logger.level == logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("exit: rebuildGraph")
             return res
         else:
@@ -49,7 +49,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
             The list of vertex types defined in the current graph.
         """
         logger.info("entry: getVertexTypes")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = []
@@ -58,8 +58,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
         for vt in vertexTypes:
             ret.append(vt["Name"])
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertexTypes")
 
         return ret
@@ -80,7 +80,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
             and it is a string.
         """
         logger.info("entry: getAttributes")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         et = await self.getVertexType(vertexType)
@@ -90,8 +90,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
             ret.append(
                 (at["AttributeName"], self._getAttrType(at["AttributeType"])))
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getAttributes")
 
         return ret
@@ -110,15 +110,15 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
             The metadata of the vertex type.
         """
         logger.info("entry: getVertexType")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         vertexTypes = await self.getSchema(force=force)
         vertexTypes = vertexTypes["VertexTypes"]
         for vt in vertexTypes:
             if vt["Name"] == vertexType:
-                if logger.level == logging.DEBUG:
-                    logger.debug("return: " + str(vt))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("return: %s", vt)
                 logger.info("exit: getVertexType (found)")
 
                 return vt
@@ -166,7 +166,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_built_in_functions_on_graph[Run built-in functions]
         """
         logger.info("entry: getVertexCount")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         # If WHERE condition is not specified, use /builtins else use /vertices
@@ -183,8 +183,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
 
                 res = res[0]["count"]
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(res))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("return: %s", res)
             logger.info("exit: getVertexCount (1)")
 
             return res
@@ -195,8 +195,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
 
         ret = _parse_get_vertex_count(res, vertexType, where)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertexCount (2)")
 
         return ret
@@ -234,7 +234,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_upsert_data_to_graph[Upsert data to graph]
         """
         logger.info("entry: upsertVertex")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         vals = _upsert_attrs(attributes)
@@ -243,8 +243,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
         ret = await self._req("POST", self.restppUrl + "/graph/" + self.graphname, data=data)
         ret = ret[0]["accepted_vertices"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertVertex")
 
         return ret
@@ -294,7 +294,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_upsert_data_to_graph[Upsert data to graph]
         """
         logger.info("entry: upsertVertices")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         headers = {}
@@ -310,8 +310,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
         ret = await self._req("POST", self.restppUrl + "/graph/" + self.graphname, data=data, headers=headers)
         ret = ret[0]["accepted_vertices"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertVertices")
 
         return ret
@@ -343,15 +343,15 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
             The number of vertices upserted.
         """
         logger.info("entry: upsertVertexDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         json_up = _prep_upsert_vertex_dataframe(
             df=df, v_id=v_id, attributes=attributes)
         ret = await self.upsertVertices(vertexType=vertexType, vertices=json_up, atomic=atomic)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: upsertVertexDataFrame")
 
         return ret
@@ -402,7 +402,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_list_vertices[List vertices]
         """
         logger.info("entry: getVertices")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url = _prep_get_vertices(
@@ -422,8 +422,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
         elif fmt == "df":
             ret = _vS2DF(ret, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertices")
 
         return ret
@@ -462,14 +462,14 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
             DataFrame.
         """
         logger.info("entry: getVertexDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = await self.getVertices(vertexType, select=select, where=where, limit=limit, sort=sort,
                                      fmt="df", withId=True, withType=False, timeout=timeout)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertexDataFrame")
 
         return ret
@@ -522,7 +522,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
         TODO Find out how/if select and timeout can be specified
         """
         logger.info("entry: getVerticesById")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         vids, url = _prep_get_vertices_by_id(
@@ -541,8 +541,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
         elif fmt == "df":
             ret = _vS2DF(ret, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVerticesById")
 
         return ret
@@ -565,14 +565,14 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
             The (selected) details of the (matching) vertex instances as pandas DataFrame.
         """
         logger.info("entry: getVertexDataFrameById")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = await self.getVerticesById(vertexType, vertexIds, select, fmt="df", withId=True,
                                          withType=False)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertexDataFrameById")
 
         return ret
@@ -608,7 +608,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_built_in_functions_on_graph[Run built-in functions]
         """
         logger.info("entry: getVertexStats")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         vts = []
@@ -628,8 +628,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
 
         ret = _parse_get_vertex_stats(responses, skipNA)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: getVertexStats")
 
         return ret
@@ -673,7 +673,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_delete_vertices[Delete vertices]
         """
         logger.info("entry: delVertices")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url = _prep_del_vertices(
@@ -689,8 +689,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
         ret = await self._req("DELETE", url)
         ret = ret["deleted_vertices"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: delVertices")
 
         return ret
@@ -718,7 +718,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_delete_a_vertex[Delete a vertex]
         """
         logger.info("entry: delVerticesById")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         url1, url2, vids = _prep_del_vertices_by_id(
@@ -734,8 +734,8 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
             res = await self._req("DELETE", url1 + str(vid) + url2)
             ret += res["deleted_vertices"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: delVerticesById")
 
         return ret
@@ -778,7 +778,7 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
 
         ret = await self._delete(url)["deleted_vertices"]
 
-        logger.debug("return: " + str(ret))
+        logger.debug("return: %s", ret)
         logger.info("exit: delVerticesByType")
 
         return ret
@@ -801,13 +801,13 @@ class AsyncPyTigerGraphVertex(AsyncPyTigerGraphUtils, AsyncPyTigerGraphSchema):
             The vertex set as a pandas DataFrame.
         """
         logger.info("entry: vertexSetToDataFrame")
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("params: " + self._locals(locals()))
 
         ret = _vS2DF(vertexSet, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("return: %s", ret)
         logger.info("exit: vertexSetToDataFrame")
 
         return ret
\ No newline at end of file
@@ -50,7 +50,7 @@ setup(
     install_requires=[
         'validators',
         'requests',
-        'httpx'],
+        'httpx>=0.24'],
     classifiers=[
         # 3 - Alpha, 4 - Beta or 5 - Production/Stable
         'Development Status :: 5 - Production/Stable',
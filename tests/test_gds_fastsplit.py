@@ -0,0 +1,26 @@
+import unittest
+
+from pyTigerGraph.gds._fastsplit import find_newlines, split_fields
+
+
+class TestGDSFastSplit(unittest.TestCase):
+    def test_find_newlines(self):
+        self.assertListEqual(find_newlines(b"1|2\n3|4\n").tolist(), [3, 7])
+        self.assertListEqual(find_newlines(b"").tolist(), [])
+
+    def test_split_fields(self):
+        fields = split_fields("99|1 0 0 1 |1\n8|1 0 0 1 |0\n", "|", 3)
+        self.assertListEqual(
+            fields.tolist(), [["99", "1 0 0 1 ", "1"], ["8", "1 0 0 1 ", "0"]])
+        fields = split_fields("é|1\n✓|2".encode("utf-8"), "|", 2)
+        self.assertListEqual(fields.tolist(), [["é", "1"], ["✓", "2"]])
+
+    def test_split_fields_fallback(self):
+        self.assertIsNone(split_fields("", "|", 2))
+        self.assertIsNone(split_fields("1|2\n3\n", "|", 2))
+        self.assertIsNone(split_fields("1|2\n\n3|4\n", "|", 2))
+        self.assertIsNone(split_fields("1||2\n", "||", 2))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2, failfast=True)
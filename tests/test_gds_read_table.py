@@ -0,0 +1,88 @@
+import io
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pyTigerGraph.gds.dataloaders import (PARALLEL_PARSE_THRESHOLD, _read_table,
+                                          _read_table_arrow, _split_list_column, pa)
+
+
+class TestGDSReadTable(unittest.TestCase):
+    def test_delimiters(self):
+        for delimiter in ["|", ",", "||", "é"]:
+            raw = delimiter.join(["1", "a", "0.5"]) + "\n" + delimiter.join(["2", "b", "1.5"]) + "\n"
+            for data in [raw, raw.encode("utf-8")]:
+                df = _read_table(data, ["id", "name", "x"], delimiter)
+                self.assertListEqual(df["id"].tolist(), [1, 2])
+                self.assertListEqual(df["name"].tolist(), ["a", "b"])
+                self.assertListEqual(df["x"].tolist(), [0.5, 1.5])
+
+    @unittest.skipIf(pa is None, "PyArrow is not installed")
+    def test_arrow_matches_pandas(self):
+        columns = {
+            "hex": ["0x1F", "2"],
+            "hex_upper": ["0XFF", "1"],
+            "plus": ["+3", "4"],
+            "leading_space": [" 1", "2"],
+            "trailing_space": ["1.5 ", "2"],
+            "inf": ["inf", "1.0"],
+            "nan": ["nan", "1.5"],
+            "uint": ["18446744073709551615", "1"],
+            "overflow": ["18446744073709551616", "1"],
+            "underflow": ["-9223372036854775809", "1"],
+            "overflow_float": ["1.5", "18446744073709551616"],
+            "underflow_float": ["1.5", "-9223372036854775809"],
+            "long_int_float": ["1.5", "-9223372036854775808"],
+            "exponent": ["1e3", "2"],
+            "empty": ["", "1"],
+            "str": ["a", "b"],
+        }
+        names = list(columns)
+        raw = "".join(
+            "|".join(columns[col][i] for col in names) + "\n" for i in range(2))
+        df = _read_table_arrow(raw, names, "|")
+        expected = pd.read_csv(
+            io.StringIO(raw), header=None, names=names, sep="|", dtype=str,
+            keep_default_na=False)
+        for col in names:
+            expected[col] = pd.to_numeric(expected[col], errors="ignore")
+        for col in names:
+            self.assertEqual(df[col].dtype, expected[col].dtype, col)
+            self.assertEqual(str(df[col].tolist()), str(expected[col].tolist()), col)
+
+    @unittest.skipIf(pa is None, "PyArrow is not installed")
+    def test_arrow_long_rows(self):
+        feature = " ".join(["0.5"] * (PARALLEL_PARSE_THRESHOLD // 2))
+        raw = "".join("{}|{}\n".format(i, feature) for i in range(3))
+        df = _read_table_arrow(raw, ["id", "x"], "|")
+        self.assertIsNotNone(df)
+        self.assertListEqual(df["id"].tolist(), [0, 1, 2])
+        self.assertTrue((df["x"] == feature).all())
+
+    def test_split_list_column(self):
+        values = pd.Series(["1 2 3 ", "4 5 6 "], dtype=object)
+        self.assertListEqual(
+            _split_list_column(values, np.dtype("int64")).tolist(), [[1, 2, 3], [4, 5, 6]])
+        self.assertListEqual(
+            _split_list_column(values, np.dtype("float32")).tolist(),
+            [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    def test_split_list_column_errors(self):
+        # Malformed and out of range elements raise as they do when splitting with pandas
+        with self.assertRaises(ValueError):
+            _split_list_column(pd.Series(["1 x 3 ", "4 5 6 "], dtype=object), np.dtype("int64"))
+        with self.assertRaises(ValueError):
+            _split_list_column(pd.Series(["1.5 2", "3 4"], dtype=object), np.dtype("int64"))
+        with self.assertRaises(OverflowError):
+            _split_list_column(
+                pd.Series(["99999999999999999999 ", "1 "], dtype=object), np.dtype("int64"))
+        with self.assertRaises(OverflowError):
+            _split_list_column(pd.Series(["300 1", "2 3"], dtype=object), np.dtype("int8"))
+        self.assertListEqual(
+            _split_list_column(pd.Series(["127 -128", "2 3"], dtype=object), np.dtype("int8")).tolist(),
+            [[127, -128], [2, 3]])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2, failfast=True)
@@ -0,0 +1,108 @@
+import unittest
+from queue import Empty, Full
+from threading import Thread
+
+from pyTigerGraph.gds._spsc import SPSCQueue
+
+
+class TestGDSSPSCQueue(unittest.TestCase):
+    def test_capacity(self):
+        q = SPSCQueue(3)
+        self.assertEqual(len(q._buffer), 4)
+        for i in range(3):
+            q.put(i)
+        self.assertTrue(q.full())
+        with self.assertRaises(Full):
+            q.put(3, block=False)
+        with self.assertRaises(Full):
+            q.put(3, timeout=0.01)
+        with self.assertRaises(ValueError):
+            SPSCQueue(0)
+
+    def test_fifo(self):
+        q = SPSCQueue(4)
+        for i in range(10):
+            q.put(i)
+            q.put(i + 0.5)
+            self.assertEqual(q.get(), i)
+            self.assertEqual(q.get(), i + 0.5)
+        self.assertTrue(q.empty())
+        with self.assertRaises(Empty):
+            q.get(block=False)
+        with self.assertRaises(Empty):
+            q.get(timeout=0.01)
+
+    def test_get_many(self):
+        q = SPSCQueue(4)
+        for i in range(3):
+            q.put(i)
+        self.assertListEqual(q.get_many(2), [0, 1])
+        q.put(3)
+        self.assertListEqual(q.get_many(8), [2, 3])
+        q.put(4)
+        q.put(5)
+        self.assertListEqual(q.get_many(8), [4, 5])
+        with self.assertRaises(Empty):
+            q.get_many(2, block=False)
+
+    def test_get_many_bound(self):
+        q = SPSCQueue(3)
+        for i in range(3):
+            q.put(i)
+        self.assertListEqual(q.get_many(3), [0, 1, 2])
+        # The items handed out still take up the queue until the next get
+        self.assertTrue(q.empty())
+        self.assertTrue(q.full())
+        with self.assertRaises(Full):
+            q.put(3, block=False)
+        with self.assertRaises(Empty):
+            q.get(block=False)
+        q.put(3)
+        self.assertEqual(q.get(), 3)
+        self.assertFalse(q.full())
+
+    def test_threads(self):
+        q = SPSCQueue(4)
+        n = 10000
+
+        def produce():
+            for i in range(n):
+                q.put(i)
+            q.put(None)
+
+        producer = Thread(target=produce)
+        producer.start()
+        received = []
+        while True:
+            item = q.get()
+            if item is None:
+                break
+            received.append(item)
+        producer.join()
+        self.assertEqual(received, list(range(n)))
+
+    def test_threads_get_many(self):
+        q = SPSCQueue(4)
+        n = 10000
+        most = []
+
+        def produce():
+            for i in range(n):
+                q.put(i)
+            q.put(None)
+
+        producer = Thread(target=produce)
+        producer.start()
+        received = []
+        while not received or received[-1] is not None:
+            items = q.get_many(4)
+            # Held items and queued items together never exceed the queue size
+            most.append(len(items) + q.qsize())
+            received.extend(items)
+        producer.join()
+        self.assertEqual(received, list(range(n)) + [None])
+        self.assertLessEqual(max(most), 4)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2, failfast=True)
@@ -96,6 +96,18 @@ class test_pyTigerGraphAuth(unittest.TestCase):
             self.assertTrue(self.conn.deleteToken(res["secret7"], token[0]))
         self.conn.dropSecret("secret7")
 
+    def test_08_getTokenCached(self):
+        self.conn.dropSecret("secret8", ignoreErrors=True)
+        res = self.conn.createSecret("secret8", True)
+        token = self.conn.getToken(res["secret8"], lifetime=3600)
+        self.assertEqual(token, self.conn.getToken(res["secret8"], lifetime=3600))
+        if isinstance(token, str): # handle plaintext tokens from TG 3.x
+            self.assertTrue(self.conn.deleteToken(res["secret8"], token))
+        else:
+            self.assertTrue(self.conn.deleteToken(res["secret8"], token[0]))
+        self.assertNotEqual(token, self.conn.getToken(res["secret8"], lifetime=3600))
+        self.conn.dropSecret("secret8")
+
 
 if __name__ == '__main__':
     unittest.main()
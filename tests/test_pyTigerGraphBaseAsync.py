@@ -1,3 +1,4 @@
+import asyncio
 import json
 import unittest
 
@@ -93,6 +94,24 @@ class test_pyTigerGraphBaseAsync(unittest.IsolatedAsyncioTestCase):
                                           "/vertices/non_existent_vertex_type/1")
         self.assertEqual("REST-30000", tge.exception.code)
 
+    async def test_05_concurrent(self):
+        # More requests than the connection pool holds wait for a free connection
+        exp = {'error': False, 'message': 'Hello GSQL'}
+        res = await asyncio.gather(
+            *(self.conn._get(self.conn.restppUrl + "/echo/", resKey=None) for _ in range(40)))
+        self.assertEqual([exp] * 40, res)
+
+    async def test_06_close(self):
+        exp = {'error': False, 'message': 'Hello GSQL'}
+        async with self.conn as conn:
+            res = await conn._get(conn.restppUrl + "/echo/", resKey=None)
+            self.assertEqual(exp, res)
+        self.assertIsNone(self.conn._async_client)
+        # The connection can still be used after it was closed
+        res = await self.conn._get(self.conn.restppUrl + "/echo/", resKey=None)
+        self.assertEqual(exp, res)
+        await self.conn.close()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -22,6 +22,15 @@ class test_pyTigerGraphUDT(unittest.TestCase):
         self.assertTrue(res[2]['fieldName'] == 'field3')
         self.assertTrue(res[2]['fieldType'] == 'DATETIME')
 
+    def test_03_getUDTCopy(self):
+        res = self.conn.getUDT("tuple2_simple")
+        res[0]['fieldName'] = 'changed'
+        res.pop()
+        # Changing the result doesn't change the cached UDT
+        res = self.conn.getUDT("tuple2_simple")
+        self.assertEqual(3, len(res))
+        self.assertEqual('field1', res[0]['fieldName'])
+
 
 if __name__ == '__main__':
     unittest.main()
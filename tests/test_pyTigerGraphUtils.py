@@ -1,8 +1,9 @@
+import json
 import re
 import unittest
 from datetime import datetime
 
-from pyTigerGraph.common.util import _safe_char
+from pyTigerGraph.common.util import _json_dumps, _safe_char
 
 from pyTigerGraphUnitTest import make_connection
 
@@ -95,6 +96,13 @@ class test_pyTigerGraphUtils(unittest.TestCase):
         self.assertEqual(
             res["message"], "RebuildNow finished, please check details in the folder: /tmp/rebuildnow")
 
+    def test_10_jsonDumps(self):
+        data = {"vertices": {"v": {"1": {"a": {"value": 1.5}, "b": {"value": None}}}}}
+        self.assertEqual(json.loads(json.dumps(data)), json.loads(_json_dumps(data)))
+        # Non-finite floats are written as json does, not as null
+        data = {"v": [float("nan"), float("inf"), -float("inf"), None]}
+        self.assertEqual('{"v": [NaN, Infinity, -Infinity, null]}', _json_dumps(data))
+
 
 if __name__ == '__main__':
     unittest.main()